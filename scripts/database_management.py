@@ -8,6 +8,8 @@ to Soulseek downloads.
 import os
 import sqlite3
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, ClassVar, Optional
 
@@ -25,6 +27,9 @@ _IMPORT_DB_PATH = (
     if _IMPORT_ENV else None
 )
 
+# Maximum number of bound parameters per IN (...) query (kept well below SQLite's limit)
+SQLITE_MAX_BATCH_PARAMS = 500
+
 
 def normalize_slskd_filename(slskd_file_name: str) -> str:
     """Normalize a slskd filename to a consistent format for storage and comparison.
@@ -79,6 +84,8 @@ class TrackDB:
 
     Attributes:
         conn: SQLite database connection
+        _playlist_cache: playlist_url -> (rowid, m3u8_path, playlist_name) for playlists
+            written by this process, so repeated lookups don't hit the database
 
     """
 
@@ -129,15 +136,70 @@ class TrackDB:
         os.makedirs(db_dir, exist_ok=True)
 
         self._initialized = True
+        self._playlist_cache: dict[str, tuple[int, str | None, str | None]] = {}
+        self._transaction_depth = 0
         write_log.info("DB_CONNECT", "Connecting to database.", {"db_path": self.db_path})
-        # Optimize SQLite connection for performance
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
-        # Enable write-ahead logging for better concurrency
-        self.conn.execute("PRAGMA journal_mode=WAL").fetchone()
-        # Optimize query performance
-        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn = self._connect()
         self._create_tables()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open a SQLite connection tuned for concurrent reads with a single writer.
+
+        Returns:
+            Configured SQLite connection
+
+        """
+        # timeout doubles as the busy timeout while other processes (e.g. the dashboard) hold locks
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        # Enable write-ahead logging so readers don't block the writer (and vice versa)
+        conn.execute("PRAGMA journal_mode=WAL").fetchone()
+        # WAL makes NORMAL durable across application crashes while avoiding an fsync per commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Memory-map up to 256MB of the database file and keep ~64MB of page cache
+        conn.execute("PRAGMA mmap_size=268435456").fetchone()
+        conn.execute("PRAGMA cache_size=-65536")
+        # Keep temporary tables and indices in memory
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Checkpoint the WAL back into the database every 1000 pages
+        conn.execute("PRAGMA wal_autocheckpoint=1000").fetchone()
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes of several TrackDB methods into a single commit.
+
+        Write methods called inside the block skip their own commit; the outermost
+        block commits once on success and rolls everything back if it raises.
+        The connection (and so the transaction depth) must be owned by one thread at
+        a time, e.g. the scheduler thread running a workflow task; worker threads of
+        the workflow's pools never call TrackDB, so they cannot touch an open block.
+
+        Example:
+            >>> with track_db.transaction():
+            ...     track_db.add_tracks_bulk(rows)
+            ...     track_db.link_tracks_to_playlist_bulk(track_ids, playlist_url)
+
+        """
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            if self._transaction_depth == 1:
+                self.conn.rollback()
+                # Cached playlist rows may describe writes that were just rolled back
+                self._playlist_cache.clear()
+            raise
+        else:
+            if self._transaction_depth == 1:
+                self.conn.commit()
+        finally:
+            self._transaction_depth -= 1
+
+    def _commit(self) -> None:
+        """Commit pending writes unless they belong to an open transaction() block."""
+        if not self._transaction_depth:
+            self.conn.commit()
+
     def clear_database(self) -> None:
         """Delete the database file and reinitialize with empty tables.
 
@@ -188,7 +250,8 @@ class TrackDB:
             write_log.warn("DB_DELETE_MISSING", "Database file does not exist.", {"db_path": db_path})
 
         # Reconnect and recreate tables
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._playlist_cache.clear()
+        self.conn = self._connect()
         self._create_tables()
 
     def _create_tables(self) -> None:
@@ -224,24 +287,20 @@ class TrackDB:
         """)
 
         # Add columns if they do not exist (migration for existing DBs)
-        cursor.execute("PRAGMA table_info(tracks)")
-        columns = [row[1] for row in cursor.fetchall()]
-        if "extension" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN extension TEXT")
-        if "bitrate" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN bitrate INTEGER")
-        if "slskd_search_uuid" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN slskd_search_uuid TEXT")
-        if "slskd_download_uuid" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN slskd_download_uuid TEXT")
-        if "username" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN username TEXT")
-        if "failed_reason" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN failed_reason TEXT")
-        if "source" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN source TEXT NOT NULL DEFAULT 'spotify'")
-        if "genre" not in columns:
-            cursor.execute("ALTER TABLE tracks ADD COLUMN genre TEXT")
+        self._add_missing_columns(cursor, "tracks", {
+            "extension": "TEXT",
+            "bitrate": "INTEGER",
+            "slskd_search_uuid": "TEXT",
+            "slskd_download_uuid": "TEXT",
+            "username": "TEXT",
+            "failed_reason": "TEXT",
+            "source": "TEXT NOT NULL DEFAULT 'spotify'",
+            "genre": "TEXT",
+            # Audio metadata read by the XML export, valid while the file's mtime and size match
+            "meta_json": "TEXT",
+            "meta_mtime": "REAL",
+            "meta_size": "INTEGER",
+        })
 
 
         # Playlists table: stores playlist information, m3u8 path, and playlist name
@@ -253,12 +312,11 @@ class TrackDB:
             )
         """)
 
-        # Ensure playlists table has display_order column for ordering by CSV
-        cursor.execute("PRAGMA table_info(playlists)")
-        playlist_columns = [row[1] for row in cursor.fetchall()]
-        if "display_order" not in playlist_columns:
-            cursor.execute("ALTER TABLE playlists ADD COLUMN display_order INTEGER")
-            self.conn.commit()
+        # Ensure playlists table has display_order (ordering by CSV) and snapshot_id (change detection)
+        self._add_missing_columns(cursor, "playlists", {
+            "display_order": "INTEGER",
+            "snapshot_id": "TEXT",
+        })
 
         # Junction table: many-to-many relationship between playlists and tracks
         cursor.execute("""
@@ -315,7 +373,23 @@ class TrackDB:
                 # Index might already exist, which is fine
                 pass
 
-        self.conn.commit()
+        self._commit()
+
+    @staticmethod
+    def _add_missing_columns(cursor: sqlite3.Cursor, table_name: str, columns: dict[str, str]) -> None:
+        """Add any of the given columns that a table is missing (migration for existing DBs).
+
+        Args:
+            cursor: Cursor on the database connection
+            table_name: Table to migrate
+            columns: Mapping of column name to its SQL type/constraint definition
+
+        """
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+        for column_name, column_def in columns.items():
+            if column_name not in existing_columns:
+                cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_def}")
 
     def add_slskd_blacklist(self, username: str, slskd_file_name: str, reason: str | None = None) -> None:
         """Add a username + slskd_file_name combination to the blacklist table.
@@ -338,7 +412,7 @@ class TrackDB:
             "INSERT OR IGNORE INTO slskd_blacklist (username, slskd_file_name, reason) VALUES (?, ?, ?)",
             (username, normalized_filename, reason),
         )
-        self.conn.commit()
+        self._commit()
 
     def is_slskd_blacklisted(self, username: str, slskd_file_name: str) -> bool:
         """Check if a username + slskd_file_name combination is blacklisted.
@@ -402,10 +476,72 @@ class TrackDB:
                track_data.slskd_file_name, track_data.extension, track_data.bitrate,
                track_data.genre),
         )
-        self.conn.commit()
+        self._commit()
+
+    def add_tracks_bulk(self, tracks: list[TrackData]) -> None:
+        """Add multiple tracks to the database in a single statement batch.
+
+        Args:
+            tracks: List of TrackData objects to insert
+
+        Note:
+            Uses INSERT OR IGNORE via executemany, so tracks that already exist
+            are left untouched. TRACK_ADD is only logged for genuinely new tracks.
+
+        """
+        if not tracks:
+            return
+
+        cursor = self.conn.cursor()
+        known_ids = self._get_existing_track_ids([track_data.track_id for track_data in tracks])
+
+        for track_data in tracks:
+            if track_data.track_id in known_ids:
+                continue
+            known_ids.add(track_data.track_id)
+            write_log.debug(
+                "TRACK_ADD", "Adding track.", {
+                    "track_id": track_data.track_id,
+                    "track_name": track_data.track_name,
+                    "artist": track_data.artist,
+                    "source": track_data.source,
+                    "status": track_data.download_status,
+                    "extension": track_data.extension,
+                    "bitrate": track_data.bitrate,
+                    "genre": track_data.genre,
+                },
+            )
+
+        cursor.executemany(
+            """
+            INSERT OR IGNORE INTO tracks
+              (track_id, track_name, artist, source, download_status,
+               failed_reason, slskd_file_name, extension, bitrate, genre)
+              VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (track_data.track_id, track_data.track_name, track_data.artist,
+                 track_data.source, track_data.download_status, track_data.failed_reason,
+                 track_data.slskd_file_name, track_data.extension, track_data.bitrate,
+                 track_data.genre)
+                for track_data in tracks
+            ],
+        )
+        self._commit()
+
+    def _get_existing_track_ids(self, track_ids: list[str]) -> set[str]:
+        """Return the subset of track_ids that already exist in the tracks table."""
+        cursor = self.conn.cursor()
+        existing: set[str] = set()
+        for i in range(0, len(track_ids), SQLITE_MAX_BATCH_PARAMS):
+            batch = track_ids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"SELECT track_id FROM tracks WHERE track_id IN ({placeholders})", batch)
+            existing.update(row[0] for row in cursor.fetchall())
+        return existing
 
     def add_playlist(self, playlist_url: str, m3u8_path: str | None = None, playlist_name: str | None = None) -> int:
-        """Add a new playlist to the database if it doesn't already exist.
+        """Add a playlist to the database, or update its m3u8_path and name if it exists.
 
         Args:
             playlist_url: Name of the playlist
@@ -415,32 +551,37 @@ class TrackDB:
         Returns:
             The database ID of the playlist (existing or newly created)
 
+        Note:
+            The write is skipped entirely when the cached row already matches.
+
         """
-        cursor = self.conn.cursor()
+        cached = self._playlist_cache.get(playlist_url)
+        if cached is not None and cached[1:] == (m3u8_path, playlist_name):
+            return cached[0]
 
-        # Check if the playlist already exists
-        cursor.execute(
-            "SELECT rowid FROM playlists WHERE playlist_url = ?",
-            (playlist_url,),
-        )
-        result = cursor.fetchone()
+        cursor = self.conn.cursor()
 
-        if result:
-            cursor.execute(
-                "UPDATE playlists SET m3u8_path = ?, playlist_name = ? WHERE playlist_url = ?",
-                (m3u8_path, playlist_name, playlist_url),
-            )
-            self.conn.commit()
-            return result[0]  # Return the existing playlist ID
+        # Only log when actually adding (existence is known once the playlist is cached)
+        if cached is None:
+            cursor.execute("SELECT 1 FROM playlists WHERE playlist_url = ?", (playlist_url,))
+            if cursor.fetchone() is None:
+                write_log.debug("PLAYLIST_ADD", "Adding playlist.", {"playlist_url": playlist_url})
 
-        # Insert the new playlist - only log when actually adding
-        write_log.debug("PLAYLIST_ADD", "Adding playlist.", {"playlist_url": playlist_url})
         cursor.execute(
-            "INSERT INTO playlists (playlist_url, m3u8_path, playlist_name) VALUES (?, ?, ?)",
+            """
+            INSERT INTO playlists (playlist_url, m3u8_path, playlist_name) VALUES (?, ?, ?)
+            ON CONFLICT(playlist_url) DO UPDATE SET
+                m3u8_path = excluded.m3u8_path,
+                playlist_name = excluded.playlist_name
+            RETURNING rowid
+            """,
             (playlist_url, m3u8_path, playlist_name),
         )
-        self.conn.commit()
-        return cursor.lastrowid
+        playlist_id = cursor.fetchone()[0]
+        self._commit()
+
+        self._playlist_cache[playlist_url] = (playlist_id, m3u8_path, playlist_name)
+        return playlist_id
 
     def update_playlist_m3u8_path(self, playlist_url: str, m3u8_path: str) -> None:
         """Update the m3u8_path for a playlist.
@@ -460,7 +601,11 @@ class TrackDB:
             "UPDATE playlists SET m3u8_path = ? WHERE playlist_url = ?",
             (m3u8_path, playlist_url),
         )
-        self.conn.commit()
+        self._commit()
+
+        cached = self._playlist_cache.get(playlist_url)
+        if cached is not None:
+            self._playlist_cache[playlist_url] = (cached[0], m3u8_path, cached[2])
 
     def update_playlist_name(self, playlist_url: str, playlist_name: str) -> None:
         """Update the playlist_name for a playlist.
@@ -480,7 +625,46 @@ class TrackDB:
             "UPDATE playlists SET playlist_name = ? WHERE playlist_url = ?",
             (playlist_name, playlist_url),
         )
-        self.conn.commit()
+        self._commit()
+
+        cached = self._playlist_cache.get(playlist_url)
+        if cached is not None:
+            self._playlist_cache[playlist_url] = (cached[0], cached[1], playlist_name)
+
+    def get_playlist_snapshot(self, playlist_url: str) -> tuple[str, str | None] | None:
+        """Return the stored snapshot_id and name of a playlist.
+
+        Args:
+            playlist_url: Playlist URL
+
+        Returns:
+            Tuple of (snapshot_id, playlist_name), or None if no snapshot is recorded
+
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT snapshot_id, playlist_name FROM playlists WHERE playlist_url = ? AND snapshot_id IS NOT NULL",
+            (playlist_url,),
+        )
+        result = cursor.fetchone()
+        return (result[0], result[1]) if result else None
+
+    def set_playlist_snapshot_id(self, playlist_url: str, snapshot_id: str | None) -> None:
+        """Record the platform snapshot_id the stored playlist tracks correspond to.
+
+        Args:
+            playlist_url: Playlist URL
+            snapshot_id: Snapshot ID from the platform, or None to force a full refetch
+
+        """
+        write_log.debug("PLAYLIST_SNAPSHOT_SET", "Setting playlist snapshot ID.",
+                       {"playlist_url": playlist_url, "snapshot_id": snapshot_id})
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "UPDATE playlists SET snapshot_id = ? WHERE playlist_url = ?",
+            (snapshot_id, playlist_url),
+        )
+        self._commit()
 
     def set_playlist_display_order(self, playlist_url: str, display_order: int) -> None:
         """Set or update the display order for a playlist, creating it if needed.
@@ -506,7 +690,7 @@ class TrackDB:
             "UPDATE playlists SET display_order = ? WHERE playlist_url = ?",
             (display_order, playlist_url),
         )
-        self.conn.commit()
+        self._commit()
 
     def link_track_to_playlist(self, track_id: str, playlist_url: str) -> None:
         """Create an association between a track and a playlist.
@@ -530,7 +714,33 @@ class TrackDB:
             "INSERT OR IGNORE INTO playlist_tracks (playlist_url, track_id) VALUES (?, ?)",
             (playlist_url, track_id),
         )
-        self.conn.commit()
+        self._commit()
+
+    def link_tracks_to_playlist_bulk(self, track_ids: list[str], playlist_url: str) -> None:
+        """Create associations between multiple tracks and a playlist in one batch.
+
+        Args:
+            track_ids: Track identifiers to link
+            playlist_url: Database playlist URL
+
+        Note:
+            Uses INSERT OR IGNORE to prevent duplicate associations.
+
+        """
+        if not track_ids:
+            return
+
+        write_log.debug(
+            "TRACKS_LINK_PLAYLIST",
+            "Linking tracks to playlist.",
+            {"track_count": len(track_ids), "playlist_url": playlist_url},
+        )
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "INSERT OR IGNORE INTO playlist_tracks (playlist_url, track_id) VALUES (?, ?)",
+            [(playlist_url, track_id) for track_id in track_ids],
+        )
+        self._commit()
 
     def update_track_status(
         self,
@@ -561,7 +771,49 @@ class TrackDB:
                 "UPDATE tracks SET download_status = ?, failed_reason = NULL WHERE track_id = ?",
                 (status, track_id),
             )
-        self.conn.commit()
+        self._commit()
+
+    def update_tracks_status_bulk(self, track_ids: list[str], status: str) -> None:
+        """Set the same non-failed download status on many tracks at once.
+
+        Clears failed_reason like update_track_status() does for non-failed statuses.
+
+        Args:
+            track_ids: Track identifiers to update
+            status: New download status (must not be "failed", which needs a reason per track)
+
+        """
+        if not track_ids:
+            return
+        write_log.debug("TRACKS_STATUS_UPDATE", "Updating status for tracks.",
+                       {"status": status, "count": len(track_ids)})
+        cursor = self.conn.cursor()
+        for i in range(0, len(track_ids), SQLITE_MAX_BATCH_PARAMS):
+            batch = track_ids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"UPDATE tracks SET download_status = ?, failed_reason = NULL WHERE track_id IN ({placeholders})",
+                (status, *batch),
+            )
+        self._commit()
+
+    def mark_tracks_failed_bulk(self, failed_reasons: dict[str, str | None]) -> None:
+        """Mark many tracks as failed, each with its own reason, in one transaction.
+
+        Args:
+            failed_reasons: Mapping of track ID to its failed_reason
+
+        """
+        if not failed_reasons:
+            return
+        write_log.debug("TRACKS_STATUS_UPDATE", "Updating status for tracks.",
+                       {"status": "failed", "count": len(failed_reasons)})
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "UPDATE tracks SET download_status = 'failed', failed_reason = ? WHERE track_id = ?",
+            [(failed_reason, track_id) for track_id, failed_reason in failed_reasons.items()],
+        )
+        self._commit()
 
     def update_slskd_file_name(
         self,
@@ -588,7 +840,7 @@ class TrackDB:
             "UPDATE tracks SET slskd_file_name = ? WHERE track_id = ?",
             (trimmed, track_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def update_extension_bitrate(
         self, track_id: str, extension: str | None = None, bitrate: int | None = None,
@@ -611,7 +863,25 @@ class TrackDB:
             "UPDATE tracks SET extension = ?, bitrate = ? WHERE track_id = ?",
             (extension, bitrate, track_id),
         )
-        self.conn.commit()
+        self._commit()
+
+    def set_file_metadata_cache_bulk(self, entries: list[tuple[str, str, float, int]]) -> None:
+        """Store extracted audio metadata for several tracks in one batch.
+
+        Args:
+            entries: (track_id, meta_json, meta_mtime, meta_size) tuples, where mtime and
+                    size are those of the file the metadata was read from
+
+        """
+        if not entries:
+            return
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "UPDATE tracks SET meta_json = ?, meta_mtime = ?, meta_size = ? WHERE track_id = ?",
+            [(meta_json, meta_mtime, meta_size, track_id) for track_id, meta_json, meta_mtime, meta_size in entries],
+        )
+        self._commit()
+        write_log.debug("TRACK_META_CACHE_UPDATE", "Stored extracted file metadata.", {"count": len(entries)})
 
     def get_tracks_by_status(self, status: str) -> list[tuple]:
         """Retrieve all tracks with a specific download status.
@@ -631,6 +901,68 @@ class TrackDB:
         )
         return cursor.fetchall()
 
+    def get_tracks_for_search(self, statuses: list[str]) -> list[tuple[str, str, str]]:
+        """Retrieve the search terms of every track in any of the given statuses in one query.
+
+        Args:
+            statuses: Download statuses to include, in priority order
+
+        Returns:
+            List of (track_id, artist, track_name) tuples, grouped in the order of statuses
+
+        """
+        write_log.info("TRACKS_QUERY_STATUS", "Querying tracks by status.", {"statuses": statuses})
+        placeholders = ",".join("?" * len(statuses))
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"SELECT track_id, artist, track_name, download_status FROM tracks "
+            f"WHERE download_status IN ({placeholders})",
+            statuses,
+        )
+        priority = {status: i for i, status in enumerate(statuses)}
+        rows = sorted(cursor.fetchall(), key=lambda row: priority[row[3]])
+        return [(track_id, artist, track_name) for track_id, artist, track_name, _ in rows]
+
+    def get_completed_tracks_needing_remux(
+        self, target_extensions: set[str],
+    ) -> list[tuple[str, str | None, str | None]]:
+        """Retrieve completed tracks whose file is not already in one of the target formats.
+
+        Tracks without a stored extension are included so the caller can fall back
+        to the file path.
+
+        Args:
+            target_extensions: Lowercase extensions that never need remuxing
+
+        Returns:
+            List of (track_id, local_file_path, extension) tuples
+
+        """
+        placeholders = ",".join("?" * len(target_extensions))
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"""
+            SELECT track_id, local_file_path, extension FROM tracks
+            WHERE download_status = 'completed'
+              AND (extension IS NULL OR lower(extension) NOT IN ({placeholders}))
+            """,
+            sorted(target_extensions),
+        )
+        return cursor.fetchall()
+
+    def get_completed_tracks_with_quality(self) -> list[tuple[str, str | None, int | None]]:
+        """Retrieve the file quality of every completed track in one query.
+
+        Returns:
+            List of (track_id, extension, bitrate) tuples
+
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT track_id, extension, bitrate FROM tracks WHERE download_status = 'completed'",
+        )
+        return cursor.fetchall()
+
     def set_search_uuid(self, track_id: str, slskd_search_uuid: str | None) -> None:
         """Set or update the search UUID for a given Spotify track.
         """
@@ -644,7 +976,7 @@ class TrackDB:
             "UPDATE tracks SET slskd_search_uuid = ? WHERE track_id = ?",
             (slskd_search_uuid, track_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def set_download_uuid(self, track_id: str, slskd_download_uuid: str | None, username: str | None = None) -> None:
         """Set or update the download UUID (and optionally username) for a given Spotify track.
@@ -666,7 +998,7 @@ class TrackDB:
                 "UPDATE tracks SET slskd_download_uuid = ? WHERE track_id = ?",
                 (slskd_download_uuid, track_id),
             )
-        self.conn.commit()
+        self._commit()
 
     def get_username_by_slskd_uuid(self, slskd_uuid: str) -> str | None:
         """Retrieve the Soulseek username associated with a download UUID.
@@ -699,7 +1031,27 @@ class TrackDB:
             "UPDATE tracks SET slskd_download_uuid = NULL WHERE slskd_download_uuid = ?",
             (slskd_uuid,),
         )
-        self.conn.commit()
+        self._commit()
+
+    def delete_slskd_mappings(self, slskd_uuids: list[str]) -> None:
+        """Clear the Soulseek download UUID mapping for many tracks at once.
+
+        Args:
+            slskd_uuids: Soulseek download UUIDs to remove
+
+        """
+        if not slskd_uuids:
+            return
+        write_log.debug("SLSKD_MAPPING_DELETE", "Clearing slskd download UUIDs.", {"count": len(slskd_uuids)})
+        cursor = self.conn.cursor()
+        for i in range(0, len(slskd_uuids), SQLITE_MAX_BATCH_PARAMS):
+            batch = slskd_uuids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"UPDATE tracks SET slskd_download_uuid = NULL WHERE slskd_download_uuid IN ({placeholders})",
+                batch,
+            )
+        self._commit()
 
     def get_track_id_by_slskd_search_uuid(self, slskd_uuid: str) -> str | None:
         """Retrieve the Spotify ID associated with a Soulseek search UUID.
@@ -747,6 +1099,34 @@ class TrackDB:
         result = cursor.fetchone()
         return result[0] if result else None
 
+    def get_track_ids_by_slskd_download_uuids(self, slskd_uuids: list[str]) -> dict[str, str]:
+        """Retrieve the Spotify IDs for many Soulseek download UUIDs at once.
+
+        Args:
+            slskd_uuids: Soulseek download UUIDs
+
+        Returns:
+            Dictionary mapping each known download UUID to its track ID.
+            Unknown UUIDs are omitted.
+
+        """
+        write_log.debug(
+            "SLSKD_QUERY_TRACK_IDS_DOWNLOAD",
+            "Querying Spotify IDs for slskd_download_uuids.",
+            {"count": len(slskd_uuids)},
+        )
+        cursor = self.conn.cursor()
+        track_ids: dict[str, str] = {}
+        for i in range(0, len(slskd_uuids), SQLITE_MAX_BATCH_PARAMS):
+            batch = slskd_uuids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"SELECT slskd_download_uuid, track_id FROM tracks WHERE slskd_download_uuid IN ({placeholders})",
+                batch,
+            )
+            track_ids.update(cursor.fetchall())
+        return track_ids
+
     def get_download_uuid_by_track_id(self, track_id: str) -> str | None:
         """Retrieve the Soulseek download UUID associated with a Spotify track ID.
         """
@@ -790,6 +1170,30 @@ class TrackDB:
         write_log.debug("TRACK_STATUS_RESULT", "Track status result.", {"track_id": track_id, "status": status})
         return status
 
+    def get_statuses_for_ids(self, track_ids: list[str]) -> dict[str, str | None]:
+        """Retrieve the download status of many tracks at once.
+
+        Args:
+            track_ids: Track identifiers
+
+        Returns:
+            Dictionary mapping each existing track ID to its download status.
+            Unknown track IDs are omitted.
+
+        """
+        write_log.debug("TRACK_STATUS_QUERY_BULK", "Querying track statuses.", {"count": len(track_ids)})
+        cursor = self.conn.cursor()
+        statuses: dict[str, str | None] = {}
+        for i in range(0, len(track_ids), SQLITE_MAX_BATCH_PARAMS):
+            batch = track_ids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"SELECT track_id, download_status FROM tracks WHERE track_id IN ({placeholders})",
+                batch,
+            )
+            statuses.update(cursor.fetchall())
+        return statuses
+
     def get_track_extension(self, track_id: str) -> str | None:
         """Retrieve the file extension of a track.
 
@@ -894,6 +1298,31 @@ class TrackDB:
         result = cursor.fetchone()
         return result[0] if result else None
 
+    def get_local_file_paths_for_ids(self, track_ids: list[str]) -> dict[str, str | None]:
+        """Retrieve the local file paths of many tracks at once.
+
+        Args:
+            track_ids: Track identifiers
+
+        Returns:
+            Dictionary mapping each existing track ID to its local file path (None if unset).
+            Unknown track IDs are omitted.
+
+        """
+        write_log.debug("TRACK_LOCAL_PATH_QUERY_BULK", "Querying local_file_path for tracks.",
+                       {"count": len(track_ids)})
+        cursor = self.conn.cursor()
+        paths: dict[str, str | None] = {}
+        for i in range(0, len(track_ids), SQLITE_MAX_BATCH_PARAMS):
+            batch = track_ids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"SELECT track_id, local_file_path FROM tracks WHERE track_id IN ({placeholders})",
+                batch,
+            )
+            paths.update(cursor.fetchall())
+        return paths
+
     def get_local_file_path(self, track_id: str) -> str | None:
         """Retrieve the local file path of a track.
 
@@ -973,7 +1402,7 @@ class TrackDB:
             "UPDATE tracks SET local_file_path = ? WHERE track_id = ?",
             (local_file_path, track_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def get_playlists_for_track(self, track_id: str) -> list:
         """Return a list of playlist URLs for a given track_id.
@@ -982,6 +1411,28 @@ class TrackDB:
         cursor.execute("SELECT playlist_url FROM playlist_tracks WHERE track_id = ?", (track_id,))
         return [row[0] for row in cursor.fetchall()]
 
+    def get_m3u8_paths_for_track(self, track_id: str) -> dict[str, str | None]:
+        """Return the M3U8 path of every playlist containing a track in one query.
+
+        Args:
+            track_id: Track identifier
+
+        Returns:
+            Dictionary mapping playlist URL to its m3u8_path (None if unset)
+
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT pt.playlist_url, p.m3u8_path
+            FROM playlist_tracks pt
+            LEFT JOIN playlists p ON p.playlist_url = pt.playlist_url
+            WHERE pt.track_id = ?
+            """,
+            (track_id,),
+        )
+        return dict(cursor.fetchall())
+
     def get_all_playlist_urls(self) -> list[str]:
         """Return all playlist URLs currently stored."""
         cursor = self.conn.cursor()
@@ -1009,7 +1460,7 @@ class TrackDB:
             "DELETE FROM playlist_tracks WHERE playlist_url = ? AND track_id = ?",
             (playlist_url, track_id),
         )
-        self.conn.commit()
+        self._commit()
 
     def delete_playlist(self, playlist_url: str) -> None:
         """Delete a playlist and all its associations."""
@@ -1021,7 +1472,8 @@ class TrackDB:
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM playlist_tracks WHERE playlist_url = ?", (playlist_url,))
         cursor.execute("DELETE FROM playlists WHERE playlist_url = ?", (playlist_url,))
-        self.conn.commit()
+        self._commit()
+        self._playlist_cache.pop(playlist_url, None)
 
     def get_playlist_usage_count(self, track_id: str) -> int:
         """Return how many playlists reference a track."""
@@ -1033,6 +1485,113 @@ class TrackDB:
         result = cursor.fetchone()
         return int(result[0]) if result and result[0] is not None else 0
 
+    def prune_tracks_for_playlist(
+        self,
+        playlist_url: str,
+        track_ids: list[str],
+    ) -> list[tuple[str, str | None]]:
+        """Unlink tracks from a playlist and delete those no playlist references anymore.
+
+        Runs as a single transaction with one commit.
+
+        Args:
+            playlist_url: Playlist to unlink the tracks from
+            track_ids: Tracks removed from the playlist
+
+        Returns:
+            List of (track_id, local_file_path) for the deleted orphan tracks, so
+            the caller can remove their files
+
+        """
+        if not track_ids:
+            return []
+
+        write_log.debug(
+            "TRACK_UNLINK_PLAYLIST",
+            "Unlinking tracks from playlist.",
+            {"count": len(track_ids), "playlist_url": playlist_url},
+        )
+        cursor = self.conn.cursor()
+        for i in range(0, len(track_ids), SQLITE_MAX_BATCH_PARAMS):
+            batch = track_ids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"DELETE FROM playlist_tracks WHERE playlist_url = ? AND track_id IN ({placeholders})",
+                (playlist_url, *batch),
+            )
+        orphans = self._delete_orphan_tracks(cursor, track_ids)
+        self._commit()
+        return orphans
+
+    def prune_playlists(self, playlist_urls: list[str]) -> list[tuple[str, str | None]]:
+        """Delete playlists and the tracks no remaining playlist references.
+
+        Runs as a single transaction with one commit.
+
+        Args:
+            playlist_urls: Playlists to delete
+
+        Returns:
+            List of (track_id, local_file_path) for the deleted orphan tracks, so
+            the caller can remove their files
+
+        """
+        if not playlist_urls:
+            return []
+
+        cursor = self.conn.cursor()
+        linked_ids: set[str] = set()
+        for i in range(0, len(playlist_urls), SQLITE_MAX_BATCH_PARAMS):
+            batch = playlist_urls[i:i + SQLITE_MAX_BATCH_PARAMS]
+            for playlist_url in batch:
+                write_log.info(
+                    "PLAYLIST_DELETE",
+                    "Deleting playlist and associations.",
+                    {"playlist_url": playlist_url},
+                )
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"SELECT track_id FROM playlist_tracks WHERE playlist_url IN ({placeholders})", batch)
+            linked_ids.update(row[0] for row in cursor.fetchall())
+            cursor.execute(f"DELETE FROM playlist_tracks WHERE playlist_url IN ({placeholders})", batch)
+            cursor.execute(f"DELETE FROM playlists WHERE playlist_url IN ({placeholders})", batch)
+
+        orphans = self._delete_orphan_tracks(cursor, sorted(linked_ids))
+        self._commit()
+        for playlist_url in playlist_urls:
+            self._playlist_cache.pop(playlist_url, None)
+        return orphans
+
+    @staticmethod
+    def _delete_orphan_tracks(cursor: sqlite3.Cursor, track_ids: list[str]) -> list[tuple[str, str | None]]:
+        """Delete the given tracks that no playlist links to, without committing.
+
+        Returns:
+            List of (track_id, local_file_path) for the deleted tracks
+
+        """
+        orphans: list[tuple[str, str | None]] = []
+        for i in range(0, len(track_ids), SQLITE_MAX_BATCH_PARAMS):
+            batch = track_ids[i:i + SQLITE_MAX_BATCH_PARAMS]
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(
+                f"""
+                SELECT t.track_id, t.local_file_path
+                FROM tracks t
+                LEFT JOIN playlist_tracks pt ON pt.track_id = t.track_id
+                WHERE t.track_id IN ({placeholders}) AND pt.track_id IS NULL
+                """,
+                batch,
+            )
+            orphans.extend(cursor.fetchall())
+
+        for i in range(0, len(orphans), SQLITE_MAX_BATCH_PARAMS):
+            batch = [track_id for track_id, _ in orphans[i:i + SQLITE_MAX_BATCH_PARAMS]]
+            for track_id in batch:
+                write_log.info("TRACK_DELETE", "Deleting track and associations.", {"track_id": track_id})
+            placeholders = ",".join("?" * len(batch))
+            cursor.execute(f"DELETE FROM tracks WHERE track_id IN ({placeholders})", batch)
+        return orphans
+
     def delete_track(self, track_id: str) -> None:
         """Delete a track and its playlist links."""
         write_log.info(
@@ -1043,7 +1602,7 @@ class TrackDB:
         cursor = self.conn.cursor()
         cursor.execute("DELETE FROM playlist_tracks WHERE track_id = ?", (track_id,))
         cursor.execute("DELETE FROM tracks WHERE track_id = ?", (track_id,))
-        self.conn.commit()
+        self._commit()
 
     def get_playlist_tracks_with_metadata(self, playlist_url: str) -> list[tuple[str, str, str, str | None]]:
         """Return track_id, artist, track_name, local_file_path for tracks in a playlist."""
@@ -1062,14 +1621,26 @@ class TrackDB:
     def get_m3u8_path_for_playlist(self, playlist_url: str) -> str:
         """Return the m3u8_path for a given playlist_url, or None if not found.
         """
+        cached = self._playlist_cache.get(playlist_url)
+        if cached is not None:
+            return cached[1]
+
         cursor = self.conn.cursor()
         cursor.execute("SELECT m3u8_path FROM playlists WHERE playlist_url = ?", (playlist_url,))
         result = cursor.fetchone()
         return result[0] if result else None
 
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection.
+
+        The WAL is checkpointed and truncated first so the main database file is
+        self-contained once the connection is closed.
+        """
         write_log.info("DB_CLOSE", "Closing database connection.")
+        try:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        except sqlite3.Error as e:
+            write_log.warn("DB_CHECKPOINT_FAIL", "Failed to checkpoint WAL before closing.", {"error": str(e)})
         self.conn.close()
 
 # --- Dashboard Helper Functions ---
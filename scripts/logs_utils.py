@@ -32,6 +32,10 @@ from typing import Any
 # Module-level flag to ensure logging is initialized only once
 _LOGGING_INITIALIZED = False
 
+# Whether any handler accepts ordinary DEBUG records; set by setup_logging().
+# Lets write_log.debug() return before building a LogRecord that every handler would drop.
+_DEBUG_ENABLED = True
+
 # JSON log format keys for structured logging
 JSON_LOG_KEYS = ["timestamp", "level", "message", "event_id", "context"]
 
@@ -728,7 +732,7 @@ def setup_logging(  # noqa: PLR0915
         Dashboard-critical logs are always written to file regardless of LOG_LEVEL.
 
     """
-    global _LOGGING_INITIALIZED  # noqa: PLW0603
+    global _LOGGING_INITIALIZED, _DEBUG_ENABLED  # noqa: PLW0603
 
     if _LOGGING_INITIALIZED:
         return
@@ -744,6 +748,9 @@ def setup_logging(  # noqa: PLR0915
     if "LOG_LEVEL" in os.environ:
         log_level = configured_level
 
+    # Console uses log_level, file uses configured_level (dashboard events bypass both)
+    _DEBUG_ENABLED = min(log_level, configured_level) <= logging.DEBUG
+
     # Determine environment-specific logs directory
     if logs_dir is None:
         ENV = os.getenv("APP_ENV", "default")
@@ -876,5 +883,11 @@ class write_log:
 
     @staticmethod
     def debug(event_id: str, msg: str, context: dict | None = None) -> None:
-        """Log debug message with event ID and optional context."""
+        """Log debug message with event ID and optional context.
+
+        Returns immediately when DEBUG output is disabled, unless the event is
+        dashboard-critical (those are always written to file).
+        """
+        if not _DEBUG_ENABLED and event_id not in _DASHBOARD_CRITICAL_EVENTS:
+            return
         logging.getLogger().debug(msg, extra={"event_id": event_id, "context": context or {}})
@@ -20,6 +20,8 @@ File Format:
 Public API:
 - write_playlist_m3u8(): Create new M3U8 file with track list
 - update_track_in_m3u8(): Replace comment with file path
+- update_tracks_in_m3u8(): Replace comments for many tracks in one rewrite
+- write_m3u8_atomic(): Replace an M3U8 file's contents atomically
 - delete_all_m3u8_files(): Remove all M3U8 files in directory
 """
 
@@ -50,17 +52,15 @@ def write_playlist_m3u8(m3u8_path: str, tracks: list[tuple[str, str, str]]) -> N
                   {"m3u8_path": m3u8_path, "track_count": len(tracks)})
 
     try:
-        with open(m3u8_path, "w", encoding="utf-8") as m3u8_file:
-            # Write M3U8 header
-            m3u8_file.write("#EXTM3U\n")
-
-            # Write each track as a comment
-            for track in tracks:
-                track_id = track[0] if len(track) > 0 else ""
-                artist = track[1] if len(track) > 1 else ""
-                track_name = track[2] if len(track) > 2 else ""
-                comment = f"# {track_id} - {artist} - {track_name}\n"
-                m3u8_file.write(comment)
+        # Build the M3U8 header and one comment per track, then write it in one go
+        lines = ["#EXTM3U\n"]
+        for track in tracks:
+            track_id = track[0] if len(track) > 0 else ""
+            artist = track[1] if len(track) > 1 else ""
+            track_name = track[2] if len(track) > 2 else ""
+            lines.append(f"# {track_id} - {artist} - {track_name}\n")
+
+        write_m3u8_atomic(m3u8_path, "".join(lines))
 
         write_log.debug("M3U8_WRITE_SUCCESS", "M3U8 file written successfully.", {"m3u8_path": m3u8_path})
     except Exception as e:
@@ -87,46 +87,81 @@ def update_track_in_m3u8(m3u8_path: str, track_id: str, local_file_path: str) ->
     Example:
         >>> update_track_in_m3u8("playlists/my_playlist.m3u8", "abc123", "E:\\downloads\\track.mp3")
 
+    """
+    update_tracks_in_m3u8(m3u8_path, {track_id: local_file_path})
+
+
+def update_tracks_in_m3u8(m3u8_path: str, local_file_paths: dict[str, str]) -> None:
+    """Replace the comments of several tracks with their file paths in one pass.
+
+    Reads the M3U8 once, replaces the first comment line of each track in
+    local_file_paths, and writes the result back atomically (temp file + os.replace).
+
+    Args:
+        m3u8_path: Path to the M3U8 file to update
+        local_file_paths: Mapping of track ID to absolute path of the downloaded file
+
+    Example:
+        >>> update_tracks_in_m3u8("playlists/my_playlist.m3u8", {"abc123": "E:\\downloads\\track.mp3"})
+
     """
     if not os.path.exists(m3u8_path):
         write_log.warn("M3U8_NOT_FOUND", "M3U8 file not found for update.", {"m3u8_path": m3u8_path})
         return
 
-    write_log.debug("M3U8_UPDATE", "Updating track in M3U8 file.",
-                   {"m3u8_path": m3u8_path, "track_id": track_id})
+    write_log.debug("M3U8_UPDATE", "Updating tracks in M3U8 file.",
+                   {"m3u8_path": m3u8_path, "track_ids": list(local_file_paths)})
 
     try:
         # Read all lines
         with open(m3u8_path, encoding="utf-8") as f:
             lines = f.readlines()
 
-        # Find and replace the matching comment
-        comment_prefix = f"# {track_id} - "
-        new_lines = []
-        replaced = False
-
-        for line in lines:
-            if line.startswith(comment_prefix) and not replaced:
-                new_lines.append(local_file_path + "\n")
-                replaced = True
-            else:
-                new_lines.append(line)
-
-        # Write back if replacement occurred
-        if replaced:
-            with open(m3u8_path, "w", encoding="utf-8") as f:
-                f.writelines(new_lines)
-            write_log.debug("M3U8_UPDATE_SUCCESS", "Track updated in M3U8 file.",
-                           {"m3u8_path": m3u8_path, "track_id": track_id})
-        else:
+        # Replace the first matching comment of each track ("# track_id - artist - track_name")
+        remaining = dict(local_file_paths)
+        for i, line in enumerate(lines):
+            if not remaining:
+                break
+            if line.startswith("# "):
+                local_file_path = remaining.pop(line[2:].split(" - ", 1)[0], None)
+                if local_file_path is not None:
+                    lines[i] = local_file_path + "\n"
+
+        # Write back if any replacement occurred
+        if len(remaining) < len(local_file_paths):
+            write_m3u8_atomic(m3u8_path, "".join(lines))
+            write_log.debug("M3U8_UPDATE_SUCCESS", "Tracks updated in M3U8 file.",
+                           {"m3u8_path": m3u8_path, "updated": len(local_file_paths) - len(remaining)})
+        if remaining:
             write_log.debug("M3U8_TRACK_NOT_FOUND", "Track comment not found in M3U8 file.",
-                           {"m3u8_path": m3u8_path, "track_id": track_id})
+                           {"m3u8_path": m3u8_path, "track_ids": list(remaining)})
 
     except Exception as e:
         write_log.error("M3U8_UPDATE_FAIL", "Failed to update M3U8 file.",
                        {"m3u8_path": m3u8_path, "error": str(e)})
 
 
+def write_m3u8_atomic(m3u8_path: str, content: str) -> None:
+    """Write M3U8 content to a temp file next to m3u8_path and atomically swap it in.
+
+    Readers never see a half-written playlist, even if the process dies mid-write.
+
+    Args:
+        m3u8_path: Path to the M3U8 file to create or replace
+        content: Full file content
+
+    """
+    tmp_path = m3u8_path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, m3u8_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
 def delete_all_m3u8_files(m3u8_dir: str) -> None:
     """Recursively delete all M3U8 files in a directory tree.
 
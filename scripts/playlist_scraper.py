@@ -15,6 +15,7 @@ Key Features:
 
 Public API:
 - get_tracks_from_playlist(): Main function to fetch playlist tracks
+- get_playlist_snapshot_id(): Version marker for change detection (Spotify only)
 - detect_platform(): Utility to identify platform from URL
 - clean_name(): Utility to normalize track/artist names
 """
@@ -195,6 +196,27 @@ def get_tracks_from_playlist(playlist_url: str) -> tuple[str, list[tuple[str, st
     )
 
 
+def get_playlist_snapshot_id(playlist_url: str) -> str | None:
+    """Return a cheap version marker for a playlist, if the platform provides one.
+
+    Spotify exposes a snapshot_id that changes whenever the playlist changes.
+    SoundCloud has no equivalent, so its playlists are always fully fetched.
+
+    Args:
+        playlist_url: Full playlist URL from any supported platform
+
+    Returns:
+        The playlist's snapshot_id, or None if the platform has no snapshot concept
+
+    """
+    if detect_platform(playlist_url) == "spotify":
+        from scripts.spotify_scraper import (  # noqa: PLC0415
+            get_playlist_snapshot_id as spotify_get_snapshot_id,
+        )
+        return spotify_get_snapshot_id(playlist_url)
+    return None
+
+
 def generate_track_id(platform: str, identifier: str) -> str:  # noqa: ARG001
     """Generate a standardized track ID for a given platform.
 
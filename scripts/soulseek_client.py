@@ -27,18 +27,24 @@ Public API:
 - initiate_track_search(): Start search without waiting (for custom workflows)
 - process_pending_searches(): Process completed searches and initiate downloads
 - query_download_status(): Poll slskd for active download states
+- iter_download_files(): Iterate (username, file) pairs from the download status response
 - process_redownload_queue(): Handle quality upgrade requests (async)
+- remove_downloads_from_slskd(): Remove finished downloads in bulk
 - wait_for_slskd_ready(): Wait for slskd service to be available
 """
 
 import os
 import time
 import uuid
-from functools import wraps
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from typing import Any
 
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
 from scripts.constants import LOSSLESS_FORMATS, MIN_BITRATE_KBPS, SUPPORTED_AUDIO_FORMATS
 from scripts.database_management import TrackDB
@@ -63,13 +69,28 @@ SEARCH_POLL_INTERVAL = 2  # seconds
 SEARCH_BATCH_SIZE = 25  # Maximum searches per batch
 SEARCH_BATCH_DELAY_SECONDS = 2.0  # Delay between batches
 
+# Concurrent slskd DELETE requests in remove_downloads_from_slskd() (stays below the session pool size)
+SLSKD_REMOVE_CONCURRENCY = 8
+
 # HTTP status codes
 HTTP_OK = 200
 HTTP_NOT_FOUND = 404
+HTTP_TOO_MANY_REQUESTS = 429
 HTTP_SERVER_ERROR = 500
 
-# Database instance
-track_db = TrackDB()
+# The database is opened on first use rather than at import
+@lru_cache(maxsize=1)
+def _get_track_db() -> TrackDB:
+    """Return the shared TrackDB instance, opening the database on first call."""
+    return TrackDB()
+
+
+# Shared HTTP session so slskd calls reuse pooled keep-alive connections.
+# Retries stay in with_retry(); the adapter only manages the connection pool.
+slskd_session = requests.Session()
+_slskd_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+slskd_session.mount("http://", _slskd_adapter)
+slskd_session.mount("https://", _slskd_adapter)
 
 
 # Retry Decorator
@@ -173,7 +194,7 @@ def wake_slskd() -> None:
     """
     try:
         # Hit the options endpoint (web UI calls this on load)
-        requests.get(
+        slskd_session.get(
             f"{SLSKD_URL}/options",
             headers={"X-API-Key": TOKEN} if TOKEN else {},
             timeout=5,
@@ -212,7 +233,7 @@ def wait_for_slskd_ready(max_wait_seconds: int = 60, poll_interval: int = 2) ->
 
         try:
             # Check the server connection state
-            resp = requests.get(
+            resp = slskd_session.get(
                 f"{SLSKD_URL}/server",
                 headers={"X-API-Key": TOKEN} if TOKEN else {},
                 timeout=5,
@@ -490,7 +511,7 @@ def select_best_file(
 
             # Check blacklist (normalization is handled inside is_slskd_blacklisted)
             if username and filename:
-                if track_db.is_slskd_blacklisted(username, filename):
+                if _get_track_db().is_slskd_blacklisted(username, filename):
                     continue  # Blacklisted file skipped
             else:
                 # Log when blacklist cannot be applied due to missing fields
@@ -563,6 +584,19 @@ def select_best_file(
 
 # API Communication Functions
 
+def _post_search(search_id: str, search_text: str) -> None:
+    """Internal helper to POST a new search to slskd."""
+    resp = slskd_session.post(
+        f"{SLSKD_URL}/searches",
+        json={"id": search_id, "searchText": search_text},
+        headers={"X-API-Key": TOKEN},
+        timeout=10,
+    )
+    write_log.debug("SLSKD_SEARCH_RESPONSE", "Search POST response.",
+                   {"status_code": resp.status_code, "response_preview": resp.text[:200]})
+    resp.raise_for_status()
+
+
 def create_search(search_text: str) -> str:
     """Initiate a search on the Soulseek network via slskd API.
 
@@ -579,15 +613,15 @@ def create_search(search_text: str) -> str:
     search_id = str(uuid.uuid4())
 
     try:
-        resp = requests.post(
-            f"{SLSKD_URL}/searches",
-            json={"id": search_id, "searchText": search_text},
-            headers={"X-API-Key": TOKEN},
-            timeout=10,
-        )
-        write_log.debug("SLSKD_SEARCH_RESPONSE", "Search POST response.",
-                       {"status_code": resp.status_code, "response_preview": resp.text[:200]})
-        resp.raise_for_status()
+        # Back off and retry when slskd rejects the search as rate limited. Timeouts are not
+        # retried: the search may already exist and a repeat POST would duplicate it.
+        post_with_retry = with_retry(
+            max_retries=3,
+            retry_on=(),
+            retry_on_status=(HTTP_TOO_MANY_REQUESTS,),
+            operation_name="create_search",
+        )(_post_search)
+        post_with_retry(search_id, search_text)
     except requests.RequestException as e:
         write_log.error("SLSKD_SEARCH_CREATE_FAIL", "Failed to create search.",
                        {"error": str(e), "search_text": search_text})
@@ -611,7 +645,7 @@ def check_search_status(search_id: str) -> tuple[bool, list[dict[str, Any]]]:
     """
     try:
         # Get search responses
-        resp = requests.get(
+        resp = slskd_session.get(
             f"{SLSKD_URL}/searches/{search_id}/responses",
             headers={"X-API-Key": TOKEN},
             timeout=10,
@@ -629,7 +663,7 @@ def check_search_status(search_id: str) -> tuple[bool, list[dict[str, Any]]]:
         # Check completion status
         is_complete = False
         try:
-            status_resp = requests.get(
+            status_resp = slskd_session.get(
                 f"{SLSKD_URL}/searches/{search_id}",
                 headers={"X-API-Key": TOKEN},
                 timeout=10,
@@ -665,7 +699,7 @@ def _make_download_request(
     url: str, payload: list[dict], attempt: int,  # noqa: ARG001
 ) -> dict[str, Any]:
     """Make the download request to slskd API."""
-    resp = requests.post(
+    resp = slskd_session.post(
         url,
         json=payload,
         headers={"X-API-Key": TOKEN},
@@ -729,10 +763,10 @@ def enqueue_download(
             # Update database after successful download enqueue
             write_log.debug("SLSKD_ENQUEUE_SUCCESS", "Successfully enqueued download.",
                           {"slskd_uuid": slskd_uuid, "track_id": track_id, "attempt": attempt + 1})
-            track_db.set_download_uuid(track_id, slskd_uuid, username)
-            track_db.update_track_status(track_id, "downloading")
-            track_db.update_slskd_file_name(track_id, filename)
-            track_db.update_extension_bitrate(track_id, extension, bitrate)
+            _get_track_db().set_download_uuid(track_id, slskd_uuid, username)
+            _get_track_db().update_track_status(track_id, "downloading")
+            _get_track_db().update_slskd_file_name(track_id, filename)
+            _get_track_db().update_extension_bitrate(track_id, extension, bitrate)
 
             return download_response
 
@@ -747,7 +781,7 @@ def enqueue_download(
             else:
                 write_log.warn("SLSKD_ENQUEUE_FAIL", "Failed to enqueue download after all retries.",
                                {"error": str(e), "filename": filename, "attempts": max_retries})
-                track_db.update_track_status(track_id, "failed", failed_reason=str(e))
+                _get_track_db().update_track_status(track_id, "failed", failed_reason=str(e))
                 raise
 
         except requests.HTTPError as e:
@@ -758,20 +792,20 @@ def enqueue_download(
             else:
                 write_log.warn("SLSKD_ENQUEUE_FAIL", "Failed to enqueue download.",
                                {"error": str(e), "filename": filename})
-                track_db.update_track_status(track_id, "failed", failed_reason=str(e))
+                _get_track_db().update_track_status(track_id, "failed", failed_reason=str(e))
                 raise
 
         except requests.RequestException as e:
             last_error = e
             write_log.warn("SLSKD_ENQUEUE_FAIL", "Failed to enqueue download.",
                            {"error": str(e), "filename": filename})
-            track_db.update_track_status(track_id, "failed", failed_reason=str(e))
+            _get_track_db().update_track_status(track_id, "failed", failed_reason=str(e))
             raise
 
         except ValueError as e:
             last_error = e
             write_log.warn("SLSKD_ENQUEUE_INVALID", "Invalid download response.", {"error": str(e)})
-            track_db.update_track_status(track_id, "failed", failed_reason=str(e))
+            _get_track_db().update_track_status(track_id, "failed", failed_reason=str(e))
             raise
 
     # This should not be reached due to raise in the loop, but just in case
@@ -798,7 +832,7 @@ def initiate_track_search(artist: str, track: str, track_id: str) -> tuple[str,
 
     """
     # Check current status
-    current_status = track_db.get_track_status(track_id)
+    current_status = _get_track_db().get_track_status(track_id)
     skip_statuses = {"completed", "queued", "downloading", "requested", "inprogress"}
 
     if current_status in skip_statuses:
@@ -811,17 +845,17 @@ def initiate_track_search(artist: str, track: str, track_id: str) -> tuple[str,
         search_id = create_search(search_text)
 
         # Store the search mapping immediately so we can find it later
-        track_db.set_search_uuid(track_id, search_id)
+        _get_track_db().set_search_uuid(track_id, search_id)
 
         # Update status to searching after mapping is stored
-        track_db.update_track_status(track_id, "searching")
+        _get_track_db().update_track_status(track_id, "searching")
 
         return (search_id, search_text, track_id)
 
     except Exception as e:
         write_log.warn("SLSKD_SEARCH_INITIATE_FAIL", "Failed to initiate search.",
                        {"artist": artist, "track": track, "error": str(e)})
-        track_db.update_track_status(track_id, "failed", failed_reason=str(e))
+        _get_track_db().update_track_status(track_id, "failed", failed_reason=str(e))
         return None
 
 
@@ -865,8 +899,8 @@ def process_search_results(
             write_log.warn("SLSKD_SEARCH_UUID_LOST", "Search UUID not found in slskd, resetting track.",
                           {"search_id": search_id, "track_id": track_id})
             # Clear the slskd_search_uuid and reset status to allow re-searching
-            track_db.set_search_uuid(track_id, None)
-            track_db.update_track_status(track_id, "not_found")
+            _get_track_db().set_search_uuid(track_id, None)
+            _get_track_db().update_track_status(track_id, "not_found")
             return True
 
         # If search is not complete, leave status as 'searching'
@@ -883,23 +917,23 @@ def process_search_results(
             remove_search_from_slskd(search_id, track_id)
 
             # Get track name and artist from database
-            track_name = track_db.get_track_name(track_id)
-            artist = track_db.get_track_artist(track_id)
+            track_name = _get_track_db().get_track_name(track_id)
+            artist = _get_track_db().get_track_artist(track_id)
 
             if not track_name:
                 write_log.warn("SLSKD_FALLBACK_NO_TRACK_NAME",
                              "Cannot perform fallback search - track name not found in database.",
                              {"track_id": track_id})
-                track_db.update_track_status(track_id, "not_found")
-                track_db.set_search_uuid(track_id, None)
+                _get_track_db().update_track_status(track_id, "not_found")
+                _get_track_db().set_search_uuid(track_id, None)
                 return True
 
             # Create new search with track name only
             try:
                 fallback_search_id = create_search(track_name)
-                track_db.set_search_uuid(track_id, fallback_search_id)
+                _get_track_db().set_search_uuid(track_id, fallback_search_id)
                 # Keep status as 'searching' - will be processed on next workflow run
-                track_db.update_track_status(track_id, "searching")
+                _get_track_db().update_track_status(track_id, "searching")
 
                 write_log.info("SLSKD_FALLBACK_SEARCH_INITIATED",
                              "Initiated fallback search with track name only (async, will process later).",
@@ -913,8 +947,8 @@ def process_search_results(
                 write_log.warn("SLSKD_FALLBACK_SEARCH_FAIL",
                              "Failed to initiate fallback search.",
                              {"track_id": track_id, "error": str(e)})
-                track_db.update_track_status(track_id, "not_found")
-                track_db.set_search_uuid(track_id, None)
+                _get_track_db().update_track_status(track_id, "not_found")
+                _get_track_db().set_search_uuid(track_id, None)
                 return True
 
         # Search is complete but no results (and this was already a fallback search)
@@ -924,18 +958,18 @@ def process_search_results(
                           {"search_text": search_text, "track_id": track_id})
             # If this was a quality upgrade attempt, revert to completed status
             if check_quality_upgrade:
-                track_db.update_track_status(track_id, "completed")
+                _get_track_db().update_track_status(track_id, "completed")
             else:
-                track_db.update_track_status(track_id, "not_found")
+                _get_track_db().update_track_status(track_id, "not_found")
             remove_search_from_slskd(search_id, track_id)
-            track_db.set_search_uuid(track_id, None)
+            _get_track_db().set_search_uuid(track_id, None)
             return True
 
         # We have results - select best file
         # If this is a fallback search, we need to filter by artist name
         artist_filter = None
         if is_fallback_search:
-            artist_filter = track_db.get_track_artist(track_id)
+            artist_filter = _get_track_db().get_track_artist(track_id)
             write_log.debug("SLSKD_FALLBACK_ARTIST_FILTER",
                           "Filtering fallback search results by artist name.",
                           {"artist_filter": artist_filter, "track_id": track_id})
@@ -957,25 +991,25 @@ def process_search_results(
 
             # If this was a quality upgrade attempt, revert to completed status
             if check_quality_upgrade:
-                track_db.update_track_status(track_id, "completed")
+                _get_track_db().update_track_status(track_id, "completed")
             else:
-                track_db.update_track_status(track_id, "no_suitable_file")
+                _get_track_db().update_track_status(track_id, "no_suitable_file")
             remove_search_from_slskd(search_id, track_id)
-            track_db.set_search_uuid(track_id, None)
+            _get_track_db().set_search_uuid(track_id, None)
             return True
 
         # If checking for quality upgrade, verify new file is actually better
         if check_quality_upgrade:
-            current_extension = track_db.get_track_extension(track_id)
+            current_extension = _get_track_db().get_track_extension(track_id)
             current_bitrate = get_track_bitrate(track_id)
 
             if not is_better_quality(best_file, current_extension, current_bitrate):
                 write_log.info("SLSKD_REDOWNLOAD_SKIP", "No better quality file found for upgrade.",
                               {"track_id": track_id, "current_extension": current_extension,
                                "current_bitrate": current_bitrate})
-                track_db.update_track_status(track_id, "completed")
+                _get_track_db().update_track_status(track_id, "completed")
                 remove_search_from_slskd(search_id, track_id)
-                track_db.set_search_uuid(track_id, None)
+                _get_track_db().set_search_uuid(track_id, None)
                 return True
 
             write_log.info("SLSKD_REDOWNLOAD_PROCESS", "Found better quality file for upgrade.",
@@ -983,14 +1017,14 @@ def process_search_results(
 
         # Enqueue download (will update status to pending/queued)
         enqueue_download(best_file, username, track_id)
-        track_db.set_search_uuid(track_id, None)
+        _get_track_db().set_search_uuid(track_id, None)
         remove_search_from_slskd(search_id, track_id)
         return True
 
     except Exception as e:
         write_log.warn("SLSKD_SEARCH_PROCESS_FAIL", "Failed to process search results.",
                        {"search_id": search_id, "track_id": track_id, "error": str(e)})
-        track_db.update_track_status(track_id, "failed", failed_reason=str(e))
+        _get_track_db().update_track_status(track_id, "failed", failed_reason=str(e))
         remove_search_from_slskd(search_id, track_id)
 
 
@@ -1013,7 +1047,34 @@ def download_tracks_async(tracks: list[tuple[str, str, str]]) -> None:
     if not tracks:
         return
 
-    # Initiate searches in batches with delays to prevent rate limiting
+    initiated_count = _initiate_searches_in_batches(
+        tracks,
+        lambda track_id, artist, track_name: initiate_track_search(artist, track_name, track_id) is not None,
+    )
+
+    if initiated_count > 0:
+        write_log.info("ASYNC_DOWNLOAD_START", "Initiated searches for tracks.",
+                      {"initiated": initiated_count, "total": len(tracks),
+                       "batch_size": SEARCH_BATCH_SIZE, "batch_delay": SEARCH_BATCH_DELAY_SECONDS})
+
+
+def _initiate_searches_in_batches(
+    tracks: list[tuple[str, str, str]],
+    initiate: Callable[[str, str, str], bool],
+) -> int:
+    """Call initiate() for each track in batches, pausing between batches.
+
+    All search-creating code paths go through this so they share the same
+    SEARCH_BATCH_SIZE / SEARCH_BATCH_DELAY_SECONDS limit against Soulseek bans.
+
+    Args:
+        tracks: List of tuples containing (track_id, artist, track_name)
+        initiate: Callback taking (track_id, artist, track_name); returns True if a search was created
+
+    Returns:
+        Number of searches initiated
+
+    """
     initiated_count = 0
     total_tracks = len(tracks)
     batch_size = SEARCH_BATCH_SIZE
@@ -1032,8 +1093,7 @@ def download_tracks_async(tracks: list[tuple[str, str, str]]) -> None:
 
         # Process current batch
         for track_id, artist, track_name in batch:
-            search_info = initiate_track_search(artist, track_name, track_id)
-            if search_info:
+            if initiate(track_id, artist, track_name):
                 initiated_count += 1
 
         # Add delay between batches (but not after the last batch)
@@ -1045,10 +1105,7 @@ def download_tracks_async(tracks: list[tuple[str, str, str]]) -> None:
             )
             time.sleep(batch_delay)
 
-    if initiated_count > 0:
-        write_log.info("ASYNC_DOWNLOAD_START", "Initiated searches for tracks.",
-                      {"initiated": initiated_count, "total": total_tracks,
-                       "batch_size": batch_size, "batch_delay": batch_delay})
+    return initiated_count
 
 
 def process_pending_searches() -> None:
@@ -1064,7 +1121,7 @@ def process_pending_searches() -> None:
     write_log.info("PROCESS_PENDING_SEARCHES", "Checking for completed searches.")
 
     # Get all tracks currently in 'searching' status
-    searching_tracks = track_db.get_tracks_by_status("searching")
+    searching_tracks = _get_track_db().get_tracks_by_status("searching")
 
     if not searching_tracks:
         return
@@ -1081,16 +1138,16 @@ def process_pending_searches() -> None:
         local_file_path = track_row[7] if len(track_row) > 7 else None  # noqa: PLR2004
 
         # Try to get the slskd search UUID for this track
-        slskd_uuid = track_db.get_search_uuid_by_track_id(track_id)
+        slskd_uuid = _get_track_db().get_search_uuid_by_track_id(track_id)
 
         if not slskd_uuid:
             # No search UUID means search was never properly initiated
-            track_db.update_track_status(track_id, "pending")
+            _get_track_db().update_track_status(track_id, "pending")
             continue
 
         # Get the actual search text from slskd to detect if it's a fallback search
         try:
-            search_resp = requests.get(
+            search_resp = slskd_session.get(
                 f"{SLSKD_URL}/searches/{slskd_uuid}",
                 headers={"X-API-Key": TOKEN},
                 timeout=10,
@@ -1143,7 +1200,7 @@ def remove_search_from_slskd(search_id: str, track_id: str | None = None, max_re
     """
     for attempt in range(max_retries):
         try:
-            resp = requests.delete(
+            resp = slskd_session.delete(
                 f"{SLSKD_URL}/searches/{search_id}",
                 headers={"X-API-Key": TOKEN},
                 timeout=10,
@@ -1156,7 +1213,7 @@ def remove_search_from_slskd(search_id: str, track_id: str | None = None, max_re
                     {"search_id": search_id, "track_id": track_id},
                 )
                 if track_id:
-                    track_db.set_search_uuid(track_id, None)
+                    _get_track_db().set_search_uuid(track_id, None)
                 return True
 
             resp.raise_for_status()
@@ -1213,10 +1270,45 @@ def remove_download_from_slskd(username: str, slskd_uuid: str, max_retries: int
         True if the download was successfully removed, False otherwise
 
     """
+    if not _delete_download_from_slskd(username, slskd_uuid, max_retries):
+        return False
+    # Also remove from our database mapping
+    _get_track_db().delete_slskd_mapping(slskd_uuid)
+    return True
+
+
+def remove_downloads_from_slskd(removals: dict[str, set[str]]) -> int:
+    """Remove many downloads from slskd, issuing the DELETE requests concurrently.
+
+    slskd has no endpoint for deleting a chosen set of transfers, so the
+    per-download requests run on a small thread pool over the shared session.
+    Database mappings for the removed downloads are then cleared in one statement.
+
+    Args:
+        removals: Soulseek username -> UUIDs of that user's downloads to remove
+
+    Returns:
+        Number of downloads successfully removed
+
+    """
+    jobs = [(username, slskd_uuid) for username, uuids in removals.items() for slskd_uuid in uuids]
+    if not jobs:
+        return 0
+
+    with ThreadPoolExecutor(max_workers=min(SLSKD_REMOVE_CONCURRENCY, len(jobs))) as executor:
+        results = list(executor.map(lambda job: _delete_download_from_slskd(*job), jobs))
+
+    removed = [slskd_uuid for (_, slskd_uuid), ok in zip(jobs, results, strict=True) if ok]
+    _get_track_db().delete_slskd_mappings(removed)
+    return len(removed)
+
+
+def _delete_download_from_slskd(username: str, slskd_uuid: str, max_retries: int = 3) -> bool:
+    """Issue the slskd DELETE for one download, with retries. Makes no database changes."""
     for attempt in range(max_retries):
         try:
             url = f"{SLSKD_URL}/transfers/downloads/{username}/{slskd_uuid}?remove=true"
-            resp = requests.delete(
+            resp = slskd_session.delete(
                 url,
                 headers={"X-API-Key": TOKEN},
                 timeout=10,
@@ -1226,8 +1318,6 @@ def remove_download_from_slskd(username: str, slskd_uuid: str, max_retries: int
                 # 200/204 = successfully removed, 404 = already gone
                 write_log.info("SLSKD_REMOVE_SUCCESS", "Successfully removed download from slskd.",
                               {"username": username, "slskd_uuid": slskd_uuid})
-                # Also remove from our database mapping
-                track_db.delete_slskd_mapping(slskd_uuid)
                 return True
 
             resp.raise_for_status()
@@ -1261,13 +1351,14 @@ def remove_download_from_slskd(username: str, slskd_uuid: str, max_retries: int
 
 def _fetch_download_status() -> list[dict[str, Any]]:
     """Internal helper to fetch download status from slskd API."""
-    resp = requests.get(
+    resp = slskd_session.get(
         f"{SLSKD_URL}/transfers/downloads",
         headers={"X-API-Key": TOKEN},
         timeout=10,
     )
     resp.raise_for_status()
-    return resp.json()
+    # The transfer list grows with the download queue and is re-read on every sync
+    return orjson.loads(resp.content)
 
 
 def query_download_status() -> list[dict[str, Any]]:
@@ -1288,11 +1379,28 @@ def query_download_status() -> list[dict[str, Any]]:
             operation_name="query_download_status",
         )(_fetch_download_status)
         return fetch_with_retry()
-    except (requests.RequestException, requests.HTTPError) as e:
+    except (requests.RequestException, requests.HTTPError, orjson.JSONDecodeError) as e:
         write_log.warn("SLSKD_QUERY_STATUS_FAIL", "Failed to query download status.", {"error": str(e)})
         return []
 
 
+def iter_download_files() -> Iterator[tuple[str | None, dict[str, Any]]]:
+    """Iterate over every download file reported by slskd.
+
+    Flattens the user -> directories -> files nesting of query_download_status()
+    so callers can process files one at a time.
+
+    Yields:
+        Tuples of (username, file) where file is the slskd file object
+
+    """
+    for status in query_download_status():
+        username = status.get("username")
+        for directory in status.get("directories", []):
+            for file in directory.get("files", []):
+                yield username, file
+
+
 def process_redownload_queue() -> None:
     """Initiate searches for tracks marked for redownload (quality upgrade).
 
@@ -1304,39 +1412,45 @@ def process_redownload_queue() -> None:
     file quality before downloading. This is done in process_pending_searches().
     """
     # Get all tracks marked for redownload
-    redownload_tracks = track_db.get_tracks_by_status("redownload_pending")
+    redownload_tracks = _get_track_db().get_tracks_by_status("redownload_pending")
 
     if not redownload_tracks:
         return
 
-    # Initiate all searches without waiting
-    initiated_count = 0
-
-    for track_row in redownload_tracks:
-        track_id, track_name, artist = track_row[0], track_row[1], track_row[2]
-
-        # Create search and update status
-        search_text = f"{artist} {track_name}"
-        try:
-            search_id = create_search(search_text)
-            track_db.set_search_uuid(track_id, search_id)
-            track_db.update_track_status(track_id, "searching")
-            initiated_count += 1
-        except Exception as e:
-            write_log.warn("SLSKD_REDOWNLOAD_SEARCH_FAIL", "Failed to create upgrade search.",
-                          {"error": str(e)})
-            track_db.update_track_status(track_id, "failed", failed_reason=str(e))
+    # Initiate all searches without waiting, using the same batching as new-track searches
+    tracks = [(track_row[0], track_row[2], track_row[1]) for track_row in redownload_tracks]
+    initiated_count = _initiate_searches_in_batches(tracks, _initiate_upgrade_search)
 
     if initiated_count > 0:
         write_log.info("SLSKD_REDOWNLOAD_SEARCHES_INITIATED", "Initiated upgrade searches.",
                       {"initiated": initiated_count})
 
 
+def _initiate_upgrade_search(track_id: str, artist: str, track_name: str) -> bool:
+    """Create a quality-upgrade search for a track and mark it as searching.
+
+    Returns:
+        True if the search was created, False otherwise
+
+    """
+    search_text = f"{artist} {track_name}"
+    try:
+        search_id = create_search(search_text)
+        _get_track_db().set_search_uuid(track_id, search_id)
+        _get_track_db().update_track_status(track_id, "searching")
+    except Exception as e:
+        write_log.warn("SLSKD_REDOWNLOAD_SEARCH_FAIL", "Failed to create upgrade search.",
+                      {"error": str(e)})
+        _get_track_db().update_track_status(track_id, "failed", failed_reason=str(e))
+        return False
+    return True
+
+
 def get_track_bitrate(track_id: str) -> int | None:
     """Helper to get the bitrate for a track using the TrackDB abstraction layer.
     """
     try:
-        return track_db.get_track_bitrate(track_id)
+        return _get_track_db().get_track_bitrate(track_id)
     except Exception:
         # Preserve existing behavior of returning None on any error
         return None
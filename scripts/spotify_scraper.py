@@ -13,11 +13,13 @@ Key Features:
 
 Public API:
 - get_tracks_from_playlist(): Main function to fetch playlist tracks
+- get_playlist_snapshot_id(): Cheap lookup of a playlist's current snapshot_id
 - clean_name(): Utility to normalize track/artist names
 """
 
 import os
 import re
+import threading
 
 import spotipy
 from dotenv import load_dotenv
@@ -27,6 +29,12 @@ from scripts.logs_utils import write_log
 
 load_dotenv()
 
+# Authenticated client shared across calls (created on first use)
+_spotify_client: spotipy.Spotify | None = None
+
+# Guards creation of _spotify_client; playlists are fetched from several worker threads
+_spotify_client_lock = threading.Lock()
+
 
 def clean_name(name: str) -> str:
     """Normalize track and artist names for improved search consistency.
@@ -181,6 +189,93 @@ def _process_track_item(
     return (track_id, artists, track_name, genre)
 
 
+def _get_spotify_client() -> spotipy.Spotify:
+    """Return the shared authenticated Spotify client, creating it on first use.
+
+    Safe to call from concurrent playlist-fetch workers: only the first caller authenticates.
+
+    Raises:
+        ValueError: If API credentials are missing
+
+    """
+    if _spotify_client is not None:
+        return _spotify_client
+    with _spotify_client_lock:
+        # Another worker may have created the client while this one waited for the lock
+        if _spotify_client is None:
+            _create_spotify_client()
+    return _spotify_client
+
+
+def _create_spotify_client() -> None:
+    """Authenticate with the Spotify API and store the client in _spotify_client.
+
+    Must be called with _spotify_client_lock held.
+
+    Raises:
+        ValueError: If API credentials are missing
+
+    """
+    global _spotify_client  # noqa: PLW0603
+
+    # Validate API credentials
+    client_id = os.getenv("SPOTIFY_CLIENT_ID")
+    client_secret = os.getenv("SPOTIFY_CLIENT_SECRET")
+
+    if not client_id or not client_secret:
+        write_log.error("SPOTIFY_CREDENTIALS_MISSING", "Spotify API credentials are not set.")
+        raise ValueError("Missing Spotify API credentials (SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET).")
+
+    # Authenticate with Spotify API
+    write_log.info("SPOTIFY_AUTH", "Authenticating with Spotify API.")
+    try:
+        auth_manager = SpotifyClientCredentials(
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+        _spotify_client = spotipy.Spotify(auth_manager=auth_manager)
+    except Exception as e:
+        write_log.error("SPOTIFY_AUTH_FAIL", "Failed to authenticate with Spotify.", {"error": str(e)})
+        raise
+
+
+def _extract_playlist_id(playlist_url: str) -> str:
+    """Extract the Spotify playlist ID from a playlist URL.
+
+    Raises:
+        ValueError: If the URL does not contain a playlist ID
+
+    """
+    match = re.search(r"playlist/([a-zA-Z0-9]+)", playlist_url)
+    if not match:
+        write_log.error("SPOTIFY_URL_INVALID", "Invalid playlist URL format.", {"playlist_url": playlist_url})
+        raise ValueError("Invalid playlist URL. Expected format: https://open.spotify.com/playlist/...")
+    return match.group(1)
+
+
+def get_playlist_snapshot_id(playlist_url: str) -> str | None:
+    """Fetch only the snapshot_id of a Spotify playlist.
+
+    Spotify changes a playlist's snapshot_id whenever its contents change, so
+    comparing it to a stored value tells whether a full track fetch is needed.
+
+    Args:
+        playlist_url: Full Spotify playlist URL
+
+    Returns:
+        The playlist's current snapshot_id, or None if Spotify didn't return one
+
+    Raises:
+        ValueError: If API credentials are missing or playlist URL is invalid
+        spotipy.SpotifyException: If the API request fails
+
+    """
+    sp = _get_spotify_client()
+    playlist_id = _extract_playlist_id(playlist_url)
+    result = sp.playlist(playlist_id, fields="snapshot_id")
+    return result.get("snapshot_id")
+
+
 def get_tracks_from_playlist(playlist_url: str) -> tuple[str, list[tuple[str, str, str, str | None]]]:
     """Extract track information and playlist name from a Spotify playlist.
 
@@ -216,33 +311,8 @@ def get_tracks_from_playlist(playlist_url: str) -> tuple[str, list[tuple[str, st
         ("5ms8IkagrFWObtzSOahVrx", "MASTER BOOT RECORD", "Skynet", "chiptune")
 
     """
-    # Validate API credentials
-    client_id = os.getenv("SPOTIFY_CLIENT_ID")
-    client_secret = os.getenv("SPOTIFY_CLIENT_SECRET")
-
-    if not client_id or not client_secret:
-        write_log.error("SPOTIFY_CREDENTIALS_MISSING", "Spotify API credentials are not set.")
-        raise ValueError("Missing Spotify API credentials (SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET).")
-
-    # Authenticate with Spotify API
-    write_log.info("SPOTIFY_AUTH", "Authenticating with Spotify API.")
-    try:
-        auth_manager = SpotifyClientCredentials(
-            client_id=client_id,
-            client_secret=client_secret,
-        )
-        sp = spotipy.Spotify(auth_manager=auth_manager)
-    except Exception as e:
-        write_log.error("SPOTIFY_AUTH_FAIL", "Failed to authenticate with Spotify.", {"error": str(e)})
-        raise
-
-    # Extract playlist ID from URL using regex
-    match = re.search(r"playlist/([a-zA-Z0-9]+)", playlist_url)
-    if not match:
-        write_log.error("SPOTIFY_URL_INVALID", "Invalid playlist URL format.", {"playlist_url": playlist_url})
-        raise ValueError("Invalid playlist URL. Expected format: https://open.spotify.com/playlist/...")
-
-    playlist_id = match.group(1)
+    sp = _get_spotify_client()
+    playlist_id = _extract_playlist_id(playlist_url)
     write_log.debug("SPOTIFY_FETCH", "Fetching playlist metadata and tracks.", {"playlist_id": playlist_id})
 
     # Fetch playlist metadata and initial batch of tracks
@@ -29,11 +29,18 @@ Task Functions (used by task_scheduler.py):
 - task_remux_existing_files(): Remux files to match format preferences
 """
 
+import functools
 import os
-import re
 import subprocess
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import TextIO
 
 from dotenv import load_dotenv
 
@@ -46,22 +53,28 @@ load_dotenv(dotenv_path)
 
 from scripts.constants import LOSSLESS_FORMATS, LOSSY_FORMATS, MIN_BITRATE_KBPS  # noqa: E402
 from scripts.database_management import TrackData, TrackDB  # noqa: E402
-from scripts.logs_utils import setup_logging, write_log  # noqa: E402
-from scripts.m3u8_manager import update_track_in_m3u8, write_playlist_m3u8  # noqa: E402
-from scripts.playlist_scraper import get_tracks_from_playlist  # noqa: E402
+from scripts.logs_utils import write_log  # noqa: E402
+from scripts.m3u8_manager import (  # noqa: E402
+    update_track_in_m3u8,
+    update_tracks_in_m3u8,
+    write_m3u8_atomic,
+    write_playlist_m3u8,
+)
 from scripts.soulseek_client import (  # noqa: E402
     download_tracks_async,
+    iter_download_files,
     process_pending_searches,
     process_redownload_queue,
-    query_download_status,
     remove_download_from_slskd,
+    remove_downloads_from_slskd,
     remove_search_from_slskd,
     wait_for_slskd_ready,
 )
-from scripts.xml_exporter import export_itunes_xml  # noqa: E402
 
-# Initialize logging with environment-specific directory - use task_scheduler logs for unified logging
-setup_logging(log_name_prefix="task_scheduler", rotate_daily=True)
+# playlist_scraper and xml_exporter pull in spotipy/mutagen, so they are imported
+# inside the scrape and export functions that need them
+
+# Logging is configured by task_scheduler, which imports this module lazily once it is set up
 write_log.debug("ENV_LOAD", "Environment variables loaded.", {"dotenv_path": dotenv_path})
 
 # Remuxing mode configuration from environment
@@ -77,6 +90,83 @@ if not ENV:
 
 write_log.info("ENV", "Running in environment.", {"ENV": ENV})
 
+# Playlists fetched concurrently by process_playlists(), and concurrent fetches allowed
+# per platform so Spotify/SoundCloud each stay within polite request rates
+PLAYLIST_CONCURRENCY = int(os.getenv("PLAYLIST_CONCURRENCY", "8"))
+_PLATFORM_FETCH_CONCURRENCY = 2
+
+# Track statuses that mean a track is already being processed or completed, so scraping
+# must not queue it for another search
+_SKIP_STATUSES: frozenset[str] = frozenset({
+    "completed", "queued", "downloading", "searching",
+    "requested", "inprogress", "redownload_pending",
+})
+
+# How often task_remux_existing_files writes its queued M3U8 updates while remuxing
+_M3U8_FLUSH_INTERVAL_SECONDS = 30
+
+# Invalid Windows filename characters (plus space) mapped to underscores for M3U8 filenames
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*, ', "_"))
+
+# FFmpeg codec arguments, resulting bitrate and log label for each remux target format
+_REMUX_TARGETS: dict[str, tuple[list[str], int | None, str]] = {
+    "wav": (["-codec:a", "pcm_s16le", "-ar", "44100"], None, "WAV"),  # 16-bit, 44.1kHz
+    "mp3": (["-codec:a", "libmp3lame", "-b:a", "320k"], 320, "MP3 320kbps"),
+}
+
+# Remux target of each known extension under the PREFER_MP3 setting (None = already in target format)
+_REMUX_TARGET_BY_EXTENSION: dict[str, str | None] = {
+    **dict.fromkeys(LOSSLESS_FORMATS, "mp3" if PREFER_MP3 else "wav"),
+    **dict.fromkeys(LOSSY_FORMATS, "mp3"),
+    "wav": "mp3" if PREFER_MP3 else None,
+    "mp3": None,
+}
+
+# Maximum concurrent FFmpeg remuxes (0 = one per CPU core)
+REMUX_MAX_WORKERS = int(os.getenv("REMUX_MAX_WORKERS", "0"))
+
+# FFmpeg -loglevel for remuxes; raise to "info" to get full FFmpeg output in ffmpeg_remux.log.
+# Levels below "error" are raised to "error": they would hide the messages that
+# _FFMPEG_CORRUPTION_MARKERS looks for, so corrupt downloads would be kept silently.
+_FFMPEG_LOGLEVELS_BELOW_ERROR = frozenset({"quiet", "panic", "fatal", "-8", "0", "8"})
+FFMPEG_LOGLEVEL = os.getenv("FFMPEG_LOGLEVEL", "error").strip().lower()
+if FFMPEG_LOGLEVEL in _FFMPEG_LOGLEVELS_BELOW_ERROR:
+    FFMPEG_LOGLEVEL = "error"
+
+# Process-wide cap on running FFmpeg processes, shared by every remux pool so
+# tasks running at the same time cannot oversubscribe the CPU
+_FFMPEG_SLOTS = threading.BoundedSemaphore(REMUX_MAX_WORKERS or os.cpu_count() or 1)
+
+# FFmpeg output fragments that mean the input cannot be read at all; only these mark a track
+# corrupt and blacklist the file. Any other FFmpeg failure (including mid-stream decode errors)
+# is a REMUX_FAIL and keeps the original file.
+_FFMPEG_CORRUPTION_MARKERS = (
+    "invalid data found",
+    "header missing",
+    "moov atom not found",
+)
+
+# Serializes writes to the shared FFmpeg log when remuxes run concurrently
+_FFMPEG_LOG_LOCK = threading.Lock()
+
+# Open FFmpeg log of the current day as (path, file); guarded by _FFMPEG_LOG_LOCK
+_ffmpeg_log: tuple[str, TextIO] | None = None
+
+# slskd download UUID -> state seen by the previous update_download_statuses() sweep
+_last_download_states: dict[str, str] = {}
+
+# slskd transfer state -> database status. "Completed, Succeeded" is handled separately
+# by _handle_completed_download(); states not listed here are stored via _normalize_download_state().
+_DOWNLOAD_STATE_STATUS: dict[str, str] = {
+    "Completed, Errored": "failed",
+    "Completed, TimedOut": "failed",
+    "Completed, Cancelled": "failed",
+    "Completed, Rejected": "failed",
+    "Completed, Aborted": "failed",
+    "Queued, Remotely": "queued",
+    "InProgress": "downloading",
+}
+
 
 # Configuration Management
 
@@ -94,30 +184,35 @@ class WorkflowConfig:
 
         """
         self.env = env
-        self.base_dir = os.path.dirname(os.path.dirname(__file__))
+        # Resolve the project root once; paths joined onto it are already absolute
+        self.base_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
 
         # Playlist configuration
-        self.playlists_dir = os.path.abspath(os.path.join(self.base_dir, "input_playlists"))
+        self.playlists_dir = os.path.join(self.base_dir, "input_playlists")
         self.playlists_csv = os.path.join(self.playlists_dir, f"playlists_{env}.csv")
 
         # Unified output structure: output/{ENV}/
-        output_env_dir = os.path.abspath(os.path.join(self.base_dir, "output", env))
+        output_env_dir = os.path.join(self.base_dir, "output", env)
 
         # Database configuration
         self.database_dir = output_env_dir
         self.db_path = os.path.join(self.database_dir, f"database_{env}.db")
 
         # M3U8 files configuration (output/{ENV}/m3u8s)
-        self.m3u8_dir = os.path.abspath(os.path.join(output_env_dir, "m3u8s"))
+        self.m3u8_dir = os.path.join(output_env_dir, "m3u8s")
 
         # XML export configuration (XML file lives directly in output/{ENV}/)
         self.xml_dir = output_env_dir
 
         # Downloads configuration
-        self.downloads_root = os.path.abspath(os.path.join(self.base_dir, "slskd_docker_data", env, "downloads"))
+        self.downloads_root = os.path.join(self.base_dir, "slskd_docker_data", env, "downloads")
 
         # Logs configuration
-        self.logs_dir = os.path.abspath(os.path.join(self.base_dir, "observability", "logs", ENV))
+        self.logs_dir = os.path.join(self.base_dir, "observability", "logs", ENV)
+
+        # Derived export values are fixed for the process lifetime, so compute them once
+        self.xml_export_path = os.path.join(self.xml_dir, f"library_{env}.xml")
+        self.music_folder_url = self._compute_music_folder_url()
 
         # Create all necessary directories
         self._ensure_directories()
@@ -131,15 +226,22 @@ class WorkflowConfig:
             self.logs_dir,
         ]
 
-        for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+        # database_dir and xml_dir are the same folder; skip duplicates and existing
+        # directories with a single stat instead of a makedirs() call each
+        for directory in dict.fromkeys(directories):
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
 
     def get_xml_export_path(self) -> str:
         """Get the path for iTunes XML library export (library_{ENV}.xml)."""
-        return os.path.join(self.xml_dir, f"library_{self.env}.xml")
+        return self.xml_export_path
 
     def get_music_folder_url(self) -> str:
-        """Get the music folder URL for iTunes XML export.
+        """Get the music folder URL for iTunes XML export."""
+        return self.music_folder_url
+
+    def _compute_music_folder_url(self) -> str:
+        """Build the music folder URL for iTunes XML export.
 
         Handles Docker container to host path conversion if needed.
         """
@@ -157,14 +259,17 @@ class WorkflowConfig:
 # Initialize configuration
 config = WorkflowConfig(ENV)
 
-# Initialize database connection
-track_db = TrackDB()
+# The database is opened on first use rather than at import
+@functools.lru_cache(maxsize=1)
+def _get_track_db() -> TrackDB:
+    """Return the shared TrackDB instance, opening the database on first call."""
+    return TrackDB()
 
 
 # Playlist Processing Functions
 
-def read_playlists_from_csv(csv_path: str) -> list[str]:
-    """Read playlist URLs from a CSV file.
+def iter_playlists_from_csv(csv_path: str) -> Iterator[str]:
+    """Yield playlist URLs from a CSV file as they are read.
 
     Each row should contain one playlist URL. Empty rows and comment lines (starting with #) are skipped.
     Inline comments after URLs (using #) are also supported.
@@ -172,22 +277,20 @@ def read_playlists_from_csv(csv_path: str) -> list[str]:
     Args:
         csv_path: Path to CSV file containing playlist URLs
 
-    Returns:
-        List of playlist URL strings
+    Yields:
+        Playlist URL strings in file order
 
     Raises:
-        FileNotFoundError: If CSV file doesn't exist
+        FileNotFoundError: If CSV file doesn't exist (raised on first iteration)
 
     Example:
-        >>> urls = read_playlists_from_csv("playlists/test/playlists_test.csv")
-        >>> len(urls)
-        5
+        >>> for url in iter_playlists_from_csv("playlists/test/playlists_test.csv"):
+        ...     process_playlist(url)
 
     """
     write_log.info("PLAYLISTS_READ", "Reading playlists from CSV.", {"csv_path": csv_path})
 
-    playlists = []
-    with open(csv_path, newline="", encoding="utf-8") as csvfile:
+    with open(csv_path, encoding="utf-8", buffering=1 << 20) as csvfile:
         for raw_line in csvfile:
             # Strip whitespace
             stripped = raw_line.strip()
@@ -197,12 +300,34 @@ def read_playlists_from_csv(csv_path: str) -> list[str]:
                 continue
 
             # Remove inline comments (text after #)
-            url = stripped.split("#")[0].strip()
+            url = stripped.partition("#")[0].strip()
 
-            # Add URL if it's not empty after removing comments
+            # Yield URL if it's not empty after removing comments
             if url:
-                playlists.append(url)
+                yield url
+
+
+def read_playlists_from_csv(csv_path: str) -> list[str]:
+    """Read all playlist URLs from a CSV file into a list.
+
+    Thin wrapper around iter_playlists_from_csv() for callers that need the full list.
+
+    Args:
+        csv_path: Path to CSV file containing playlist URLs
 
+    Returns:
+        List of playlist URL strings
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+
+    Example:
+        >>> urls = read_playlists_from_csv("playlists/test/playlists_test.csv")
+        >>> len(urls)
+        5
+
+    """
+    playlists = list(iter_playlists_from_csv(csv_path))
     write_log.info("PLAYLISTS_READ_SUCCESS", "Successfully read playlists.", {"count": len(playlists)})
     return playlists
 
@@ -223,11 +348,8 @@ def sanitize_playlist_name(playlist_name: str) -> str:
         'My_Playlist_Best_Songs'
 
     """
-    # Replace invalid Windows filename characters with underscores
-    sanitized = re.sub(r'[<>:"/\\|?*,]', "_", playlist_name)
-    # Replace spaces with underscores
-    sanitized = sanitized.replace(" ", "_")
-    return sanitized
+    # Replace invalid Windows filename characters and spaces with underscores in a single pass
+    return playlist_name.translate(_SANITIZE_TABLE)
 
 
 def _delete_local_file(local_file_path: str | None, track_id: str) -> None:
@@ -236,19 +358,18 @@ def _delete_local_file(local_file_path: str | None, track_id: str) -> None:
         return
 
     try:
-        if os.path.exists(local_file_path):
-            os.remove(local_file_path)
-            write_log.info(
-                "AUDIO_FILE_DELETED",
-                "Deleted audio file for removed track.",
-                {"track_id": track_id, "file_path": local_file_path},
-            )
-        else:
-            write_log.debug(
-                "AUDIO_FILE_MISSING",
-                "Audio file already absent during deletion.",
-                {"track_id": track_id, "file_path": local_file_path},
-            )
+        os.remove(local_file_path)
+        write_log.info(
+            "AUDIO_FILE_DELETED",
+            "Deleted audio file for removed track.",
+            {"track_id": track_id, "file_path": local_file_path},
+        )
+    except FileNotFoundError:
+        write_log.debug(
+            "AUDIO_FILE_MISSING",
+            "Audio file already absent during deletion.",
+            {"track_id": track_id, "file_path": local_file_path},
+        )
     except Exception as e:
         write_log.warn(
             "AUDIO_FILE_DELETE_FAIL",
@@ -257,38 +378,29 @@ def _delete_local_file(local_file_path: str | None, track_id: str) -> None:
         )
 
 
-def _remove_track_if_orphaned(track_id: str, local_file_path: str | None) -> None:
-    """Delete track row and file when no playlists reference it."""
-    remaining = track_db.get_playlist_usage_count(track_id)
-    if remaining > 0:
-        return
-
-    track_db.delete_track(track_id)
-    _delete_local_file(local_file_path, track_id)
-
-
 def _rewrite_playlist_m3u8_from_db(playlist_url: str, m3u8_path: str) -> None:
     """Rewrite an M3U8 file to match current DB state for a playlist."""
     if not m3u8_path:
         return
 
-    tracks = track_db.get_playlist_tracks_with_metadata(playlist_url)
+    tracks = _get_track_db().get_playlist_tracks_with_metadata(playlist_url)
 
     if not tracks:
-        if os.path.exists(m3u8_path):
-            try:
-                os.remove(m3u8_path)
-                write_log.info(
-                    "M3U8_DELETE_EMPTY_PLAYLIST",
-                    "Removed M3U8 file for empty playlist.",
-                    {"playlist_url": playlist_url, "m3u8_path": m3u8_path},
-                )
-            except Exception as e:
-                write_log.warn(
-                    "M3U8_DELETE_EMPTY_FAIL",
-                    "Failed to delete empty playlist M3U8 file.",
-                    {"playlist_url": playlist_url, "m3u8_path": m3u8_path, "error": str(e)},
-                )
+        try:
+            os.remove(m3u8_path)
+            write_log.info(
+                "M3U8_DELETE_EMPTY_PLAYLIST",
+                "Removed M3U8 file for empty playlist.",
+                {"playlist_url": playlist_url, "m3u8_path": m3u8_path},
+            )
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            write_log.warn(
+                "M3U8_DELETE_EMPTY_FAIL",
+                "Failed to delete empty playlist M3U8 file.",
+                {"playlist_url": playlist_url, "m3u8_path": m3u8_path, "error": str(e)},
+            )
         return
 
     try:
@@ -301,8 +413,7 @@ def _rewrite_playlist_m3u8_from_db(playlist_url: str, m3u8_path: str) -> None:
                 name_text = track_name or ""
                 lines.append(f"# {track_id} - {artist_text} - {name_text}\n")
 
-        with open(m3u8_path, "w", encoding="utf-8") as f:
-            f.writelines(lines)
+        write_m3u8_atomic(m3u8_path, "".join(lines))
     except Exception as e:
         write_log.error(
             "M3U8_REWRITE_FAIL",
@@ -319,43 +430,39 @@ def _prune_removed_tracks_for_playlist(
 ) -> None:
     """Remove tracks that are no longer present in the Spotify playlist."""
     current_ids = {track[0] for track in current_tracks}
-    existing_ids = set(track_db.get_track_ids_for_playlist(playlist_url))
+    existing_ids = set(_get_track_db().get_track_ids_for_playlist(playlist_url))
     removed_ids = existing_ids - current_ids
 
     if not removed_ids:
         return
 
-    removed_count = 0
-    for track_id in removed_ids:
-        local_file_path = track_db.get_local_file_path(track_id)
-        track_db.unlink_track_from_playlist(track_id, playlist_url)
-        _remove_track_if_orphaned(track_id, local_file_path)
-        removed_count += 1
+    orphans = _get_track_db().prune_tracks_for_playlist(playlist_url, list(removed_ids))
+    for track_id, local_file_path in orphans:
+        _delete_local_file(local_file_path, track_id)
 
     _rewrite_playlist_m3u8_from_db(playlist_url, m3u8_path)
 
     write_log.info(
         "PLAYLIST_TRACKS_PRUNED",
         "Removed tracks no longer present in playlist input.",
-        {"playlist_url": playlist_url, "playlist_name": playlist_name, "removed": removed_count},
+        {"playlist_url": playlist_url, "playlist_name": playlist_name, "removed": len(removed_ids)},
     )
 
 
 def _prune_missing_playlists(input_playlist_urls: list[str]) -> None:
     """Remove playlists absent from input CSV and clean up orphaned tracks/files."""
     desired = set(input_playlist_urls)
-    existing = set(track_db.get_all_playlist_urls())
+    existing = set(_get_track_db().get_all_playlist_urls())
     missing = existing - desired
 
     if not missing:
         return
 
-    for playlist_url in missing:
-        m3u8_path = track_db.get_m3u8_path_for_playlist(playlist_url)
-        tracks = track_db.get_playlist_tracks_with_metadata(playlist_url)
-        track_db.delete_playlist(playlist_url)
+    m3u8_paths = {playlist_url: _get_track_db().get_m3u8_path_for_playlist(playlist_url) for playlist_url in missing}
+    orphans = _get_track_db().prune_playlists(sorted(missing))
 
-        if m3u8_path and os.path.exists(m3u8_path):
+    for playlist_url, m3u8_path in m3u8_paths.items():
+        if m3u8_path:
             try:
                 os.remove(m3u8_path)
                 write_log.info(
@@ -363,6 +470,8 @@ def _prune_missing_playlists(input_playlist_urls: list[str]) -> None:
                     "Deleted M3U8 file for removed playlist.",
                     {"playlist_url": playlist_url, "m3u8_path": m3u8_path},
                 )
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 write_log.warn(
                     "M3U8_DELETE_PLAYLIST_FAIL",
@@ -370,8 +479,8 @@ def _prune_missing_playlists(input_playlist_urls: list[str]) -> None:
                     {"playlist_url": playlist_url, "m3u8_path": m3u8_path, "error": str(e)},
                 )
 
-        for track_id, _, _, local_file_path in tracks:
-            _remove_track_if_orphaned(track_id, local_file_path)
+    for track_id, local_file_path in orphans:
+        _delete_local_file(local_file_path, track_id)
 
     write_log.info(
         "PLAYLISTS_PRUNED",
@@ -380,11 +489,164 @@ def _prune_missing_playlists(input_playlist_urls: list[str]) -> None:
     )
 
 
-def process_playlist(playlist_url: str) -> list[tuple[str, str, str]]:
+def _fetch_playlist_snapshot_id(playlist_url: str) -> str | None:
+    """Fetch the playlist's current snapshot_id, or None if unavailable.
+
+    Failures are logged and treated as "unknown" so the playlist is fully fetched.
+    """
+    from scripts.playlist_scraper import get_playlist_snapshot_id  # noqa: PLC0415
+
+    try:
+        return get_playlist_snapshot_id(playlist_url)
+    except Exception as e:
+        write_log.warn("PLAYLIST_SNAPSHOT_FAIL", "Failed to fetch playlist snapshot ID.",
+                      {"playlist_url": playlist_url, "error": str(e)})
+        return None
+
+
+def _get_known_snapshot_id(playlist_url: str) -> str | None:
+    """Return the stored snapshot_id if the stored playlist can be reused when it matches."""
+    stored = _get_track_db().get_playlist_snapshot(playlist_url)
+    if not stored or not stored[1]:
+        return None
+    return stored[0]
+
+
+def _fetch_playlist_remote(
+    playlist_url: str,
+    known_snapshot_id: str | None,
+    platform_slots: dict[str, threading.BoundedSemaphore] | None = None,
+) -> tuple[str | None, tuple[str, list[tuple], str] | None]:
+    """Fetch a playlist from its platform, skipping the track fetch when unchanged.
+
+    Only performs network I/O (no database access), so it is safe to run on a
+    worker thread.
+
+    Args:
+        playlist_url: Playlist URL (Spotify or SoundCloud)
+        known_snapshot_id: Stored snapshot_id from _get_known_snapshot_id()
+        platform_slots: Optional per-platform semaphores bounding concurrent fetches
+
+    Returns:
+        Tuple of (snapshot_id, fetched). fetched is (playlist_name, tracks, source),
+        or None if the snapshot is unchanged or the fetch failed.
+
+    """
+    from scripts.playlist_scraper import detect_platform, get_tracks_from_playlist  # noqa: PLC0415
+
+    slot = (platform_slots or {}).get(detect_platform(playlist_url))
+    if slot:
+        slot.acquire()
+    try:
+        snapshot_id = _fetch_playlist_snapshot_id(playlist_url)
+        if snapshot_id and snapshot_id == known_snapshot_id:
+            return snapshot_id, None
+
+        # Fetch playlist metadata and tracks from the appropriate platform
+        try:
+            playlist_name, tracks, source = get_tracks_from_playlist(playlist_url)
+            write_log.info("PLAYLIST_FETCH_SUCCESS", "Fetched tracks from playlist.",
+                          {"playlist_name": playlist_name, "track_count": len(tracks), "source": source})
+        except Exception as e:
+            write_log.error("PLAYLIST_FETCH_FAIL", "Failed to get tracks for playlist.",
+                           {"playlist_url": playlist_url, "error": str(e)})
+            return snapshot_id, None
+
+        return snapshot_id, (playlist_name, tracks, source)
+    finally:
+        if slot:
+            slot.release()
+
+
+def _get_unchanged_playlist_tracks(
+    playlist_url: str,
+    snapshot_id: str | None,
+) -> tuple[str, list[tuple[str, str, str]], str] | None:
+    """Return the stored playlist if its snapshot_id matches the current one.
+
+    Args:
+        playlist_url: Playlist URL
+        snapshot_id: Current snapshot_id from the platform (None disables the shortcut)
+
+    Returns:
+        Tuple of (playlist_name, tracks, source) built from the database, or None
+        if the playlist must be fetched from the platform
+
+    """
+    if not snapshot_id:
+        return None
+
+    stored = _get_track_db().get_playlist_snapshot(playlist_url)
+    if not stored or stored[0] != snapshot_id or not stored[1]:
+        return None
+
+    tracks = [
+        (track_id, artist, track_name)
+        for track_id, artist, track_name, _ in _get_track_db().get_playlist_tracks_with_metadata(playlist_url)
+    ]
+    write_log.info("PLAYLIST_UNCHANGED", "Playlist snapshot unchanged; using stored tracks.",
+                  {"playlist_name": stored[1], "track_count": len(tracks), "snapshot_id": snapshot_id})
+    return stored[1], tracks, "spotify"
+
+
+def _load_playlist_tracks(
+    playlist_url: str,
+    remote: tuple[str | None, tuple[str, list[tuple], str] | None] | None = None,
+) -> tuple[str, list[tuple], str, str | None] | None:
+    """Load a playlist's name and tracks, skipping the platform fetch when unchanged.
+
+    Args:
+        playlist_url: Playlist URL (Spotify or SoundCloud)
+        remote: Result of _fetch_playlist_remote() if already fetched; fetched here otherwise
+
+    Returns:
+        Tuple of (playlist_name, tracks, source, new_snapshot_id). new_snapshot_id is
+        the snapshot to record once the tracks are stored, or None if there is nothing
+        new to record. Returns None if the playlist could not be fetched.
+
+    """
+    if remote is None:
+        remote = _fetch_playlist_remote(playlist_url, _get_known_snapshot_id(playlist_url))
+    snapshot_id, fetched = remote
+
+    cached = _get_unchanged_playlist_tracks(playlist_url, snapshot_id)
+    if cached:
+        return (*cached, None)
+    if fetched is None:
+        return None
+
+    return (*fetched, snapshot_id)
+
+
+def _select_tracks_to_download(track_rows: list[TrackData]) -> list[tuple[str, str, str]]:
+    """Pick the playlist tracks that still need to be searched for.
+
+    Statuses are loaded in one query; tracks already being processed or completed are skipped.
+
+    Args:
+        track_rows: Playlist tracks as stored in the database
+
+    Returns:
+        List of (track_id, artist, track_name) tuples, the format expected by the download tasks
+
+    """
+    statuses = _get_track_db().get_statuses_for_ids([row.track_id for row in track_rows])
+    return [
+        (row.track_id, row.artist, row.track_name)
+        for row in track_rows
+        if statuses.get(row.track_id) not in _SKIP_STATUSES
+    ]
+
+
+def process_playlist(
+    playlist_url: str,
+    remote: tuple[str | None, tuple[str, list[tuple], str] | None] | None = None,
+) -> list[tuple[str, str, str]]:
     """Process a single playlist: fetch tracks and add to database.
 
     This function:
     1. Fetches playlist name and tracks from Spotify or SoundCloud
+       (served from the database when the Spotify snapshot_id is unchanged)
     2. Generates M3U8 file path
     3. Adds playlist to database
     4. Creates M3U8 file with track comments
@@ -393,26 +655,24 @@ def process_playlist(playlist_url: str) -> list[tuple[str, str, str]]:
 
     Args:
         playlist_url: Playlist URL (Spotify or SoundCloud)
+        remote: Result of _fetch_playlist_remote() when prefetched by process_playlists()
 
     Returns:
         List of tracks to be downloaded: [(track_id, artist, track_name), ...]
 
     Note:
-        Errors are logged but don't stop processing. Individual track
-        failures are isolated and won't affect other tracks.
+        Steps 5 and 6, together with recording the playlist's new snapshot_id,
+        are all-or-nothing: if any of them fails, the transaction is rolled back
+        for the whole playlist, the error is logged and None is returned.
+        Pruning, M3U8 and status-lookup errors are logged and processing continues.
 
     """
     write_log.info("PLAYLIST_PROCESS", "Processing playlist.", {"playlist_url": playlist_url})
 
-    # Fetch playlist metadata and tracks from the appropriate platform
-    try:
-        playlist_name, tracks, source = get_tracks_from_playlist(playlist_url)
-        write_log.info("PLAYLIST_FETCH_SUCCESS", "Fetched tracks from playlist.",
-                      {"playlist_name": playlist_name, "track_count": len(tracks), "source": source})
-    except Exception as e:
-        write_log.error("PLAYLIST_FETCH_FAIL", "Failed to get tracks for playlist.",
-                       {"playlist_url": playlist_url, "error": str(e)})
+    fetched = _load_playlist_tracks(playlist_url, remote)
+    if fetched is None:
         return None
+    playlist_name, tracks, source, new_snapshot_id = fetched
 
     # Generate M3U8 file path with sanitized playlist name
     safe_name = sanitize_playlist_name(playlist_name)
@@ -420,9 +680,7 @@ def process_playlist(playlist_url: str) -> list[tuple[str, str, str]]:
 
     # Add playlist to database
     try:
-        playlist_id = track_db.add_playlist(playlist_url, m3u8_path, playlist_name)
-        track_db.update_playlist_m3u8_path(playlist_url, m3u8_path)
-        track_db.update_playlist_name(playlist_url, playlist_name)
+        playlist_id = _get_track_db().add_playlist(playlist_url, m3u8_path, playlist_name)
         write_log.debug("PLAYLIST_DB_SUCCESS", "Playlist added to database.",
                        {"playlist_id": playlist_id, "playlist_url": playlist_url})
     except Exception as e:
@@ -450,51 +708,44 @@ def process_playlist(playlist_url: str) -> list[tuple[str, str, str]]:
     else:
         write_log.debug("M3U8_EXISTS", "M3U8 file already exists, preserving it.", {"m3u8_path": m3u8_path})
 
-    # Add tracks to database and collect for batch download
-    tracks_to_download = []
+    # Build track rows for a single batched insert
+    track_rows = []
     for track in tracks:
-        try:
-            # Handle both 3-element (legacy) and 4-element (with genre) tuples
-            if len(track) >= 4:  # noqa: PLR2004
-                track_id, artist, track_name, genre = track[0], track[1], track[2], track[3]
-            else:
-                track_id, artist, track_name = track[0], track[1], track[2]
-                genre = None
-
-            # Add track to database (INSERT OR IGNORE - won't duplicate)
-            track_db.add_track(TrackData(
-                track_id=track_id,
-                track_name=track_name,
-                artist=artist,
-                source=source,
-                genre=genre,
-            ))
-
-            # Link track to playlist in database
-            track_db.link_track_to_playlist(track_id, playlist_url)
-
-            # Only collect tracks that need to be searched for
-            # Skip tracks that are already being processed or completed
-            current_status = track_db.get_track_status(track_id)
-            skip_statuses = {
-                "completed", "queued", "downloading", "searching",
-                "requested", "inprogress", "redownload_pending",
-            }
-
-            if current_status not in skip_statuses:
-                # Pass only (track_id, artist, track_name) for download compatibility
-                tracks_to_download.append((track_id, artist, track_name))
+        # Handle both 3-element (legacy) and 4-element (with genre) tuples
+        if len(track) >= 4:  # noqa: PLR2004
+            track_id, artist, track_name, genre = track[0], track[1], track[2], track[3]
+        else:
+            track_id, artist, track_name = track[0], track[1], track[2]
+            genre = None
+        track_rows.append(TrackData(
+            track_id=track_id,
+            track_name=track_name,
+            artist=artist,
+            source=source,
+            genre=genre,
+        ))
+
+    # Add tracks (INSERT OR IGNORE - won't duplicate), link them to the playlist and record
+    # the snapshot they describe in one transaction, so a failure leaves none of them behind
+    try:
+        track_db = _get_track_db()
+        with track_db.transaction():
+            track_db.add_tracks_bulk(track_rows)
+            track_db.link_tracks_to_playlist_bulk([row.track_id for row in track_rows], playlist_url)
+            if new_snapshot_id:
+                track_db.set_playlist_snapshot_id(playlist_url, new_snapshot_id)
+    except Exception as e:
+        write_log.error("PLAYLIST_TRACKS_DB_FAIL", "Failed to add tracks for playlist.",
+                       {"playlist_url": playlist_url, "track_count": len(track_rows), "error": str(e)})
+        return None
 
-        except Exception as e:
-            track_name = track[2] if len(track) > 2 else str(track)  # noqa: PLR2004
-            write_log.error("TRACK_PROCESS_FAIL", "Failed to process track.",
-                           {"track": track_name, "error": str(e)})
-            # Update database status if possible
-            if len(track) > 0:
-                try:
-                    track_db.update_track_status(track[0], "failed", failed_reason=str(e))
-                except Exception:
-                    pass  # If status update fails, continue anyway
+    # Collect tracks for batch download
+    try:
+        tracks_to_download = _select_tracks_to_download(track_rows)
+    except Exception as e:
+        write_log.error("PLAYLIST_TRACK_STATUS_FAIL", "Failed to load track statuses for playlist.",
+                       {"playlist_url": playlist_url, "error": str(e)})
+        tracks_to_download = []
 
     try:
         _rewrite_playlist_m3u8_from_db(playlist_url, m3u8_path)
@@ -508,6 +759,39 @@ def process_playlist(playlist_url: str) -> list[tuple[str, str, str]]:
     return tracks_to_download
 
 
+def process_playlists(playlist_urls: Iterable[str]) -> list[list[tuple[str, str, str]] | None]:
+    """Process several playlists, overlapping their platform fetches.
+
+    Playlist fetches are network-bound, so they run on a thread pool of
+    PLAYLIST_CONCURRENCY workers with at most _PLATFORM_FETCH_CONCURRENCY
+    in flight per platform. Each fetch is submitted as soon as its URL is
+    read, so a lazy source such as iter_playlists_from_csv() overlaps with
+    the fetches. Database and M3U8 work stays on the calling thread and
+    runs in input order.
+
+    Args:
+        playlist_urls: Playlist URLs (Spotify or SoundCloud), consumed once
+
+    Returns:
+        process_playlist() result for each URL, in input order
+
+    """
+    from scripts.playlist_scraper import detect_platform  # noqa: PLC0415
+
+    platform_slots: dict[str, threading.BoundedSemaphore] = {}
+    submitted = []
+
+    with ThreadPoolExecutor(max_workers=max(1, PLAYLIST_CONCURRENCY)) as executor:
+        for url in playlist_urls:
+            platform_slots.setdefault(
+                detect_platform(url), threading.BoundedSemaphore(_PLATFORM_FETCH_CONCURRENCY),
+            )
+            future = executor.submit(_fetch_playlist_remote, url, _get_known_snapshot_id(url), platform_slots)
+            submitted.append((url, future))
+
+        return [process_playlist(url, future.result()) for url, future in submitted]
+
+
 # Download Status Management Functions
 
 def update_download_statuses() -> None:
@@ -524,17 +808,85 @@ def update_download_statuses() -> None:
         to keep the database synchronized with actual download states.
 
     """
+    global _last_download_states  # noqa: PLW0603
     write_log.info("DOWNLOAD_STATUS_UPDATE", "Checking download statuses from slskd.")
 
-    download_statuses = query_download_status()
+    download_files = list(iter_download_files())
+    current_states = {file["id"]: file.get("state") for _, file in download_files if file.get("id")}
+
+    # Resolve all download UUIDs up front; file paths, remuxes and M3U8 updates
+    # are likewise prefetched or collected during the scan and applied in bulk
+    slskd_uuids = [file["id"] for _, file in download_files if file.get("id")]
+    track_db = _get_track_db()
+    track_ids_by_uuid = track_db.get_track_ids_by_slskd_download_uuids(slskd_uuids)
+    db_statuses = track_db.get_statuses_for_ids(list(set(track_ids_by_uuid.values())))
+
+    all_files_count = len(download_files)
+    download_files = [
+        (username, file) for username, file in download_files
+        if not _is_unchanged_download(file, track_ids_by_uuid, db_statuses)
+    ]
+
+    batch = _DownloadSyncBatch(
+        track_ids_by_uuid=track_ids_by_uuid,
+        duplicate_keys_by_track={
+            track_id: _duplicate_record_key(path)
+            for track_id, path in track_db.get_local_file_paths_for_ids(list(set(track_ids_by_uuid.values()))).items()
+            if path
+        },
+    )
+
+    for username, file in download_files:
+        _update_file_status(file, username, batch)
+
+    _write_status_updates(batch.status_updates)
+    _run_pending_remuxes(batch)
+    _write_m3u8_updates(batch.m3u8_updates)
+    remove_downloads_from_slskd(batch.removals)
+    _last_download_states = current_states
+
+    write_log.info("DOWNLOAD_STATUS_SYNC_DONE", "Download status sync complete.",
+                  {"files": all_files_count, "unchanged": all_files_count - len(download_files),
+                   **batch.status_counts})
+
+
+def _is_unchanged_download(file: dict, track_ids_by_uuid: dict[str, str], db_statuses: dict[str, str | None]) -> bool:
+    """Check whether a queued/in-progress download needs no update in this sweep.
+
+    The download must be in the state seen by the previous sweep and its track must
+    still hold the status that state maps to; the latter catches status changes made
+    elsewhere (e.g. a re-search). Completed downloads are never skipped since they are
+    removed from slskd afterwards.
+    """
+    state = file.get("state")
+    if state is None or state.startswith("Completed"):
+        return False
+    slskd_uuid = file.get("id")
+    if _last_download_states.get(slskd_uuid) != state:
+        return False
+    track_id = track_ids_by_uuid.get(slskd_uuid)
+    if track_id is None:
+        return True
+    expected_status = _DOWNLOAD_STATE_STATUS.get(state) or _normalize_download_state(state)
+    return db_statuses.get(track_id) == expected_status
+
+
+def _meets_quality_target(extension: str | None, bitrate: int | None) -> bool:
+    """Check whether a completed file already meets the PREFER_MP3 quality target.
+
+    Args:
+        extension: File extension
+        bitrate: File bitrate in kbps
+
+    Returns:
+        True for MP3 at MIN_BITRATE_KBPS or better when PREFER_MP3 is set, True for WAV otherwise
 
-    for status in download_statuses:
-        username = status.get("username")
-        directories = status.get("directories", [])
-        for directory in directories:
-            files = directory.get("files", [])
-            for file in files:
-                _update_file_status(file, username)
+    """
+    if PREFER_MP3:
+        # Target: MP3 320kbps
+        return bool(extension and extension.lower() == "mp3" and bitrate and bitrate >= MIN_BITRATE_KBPS)
+    # Target: WAV (lossless)
+    return bool(extension and extension.lower() == "wav")
 
 
 def mark_tracks_for_quality_upgrade() -> None:
@@ -561,8 +913,8 @@ def mark_tracks_for_quality_upgrade() -> None:
     """
     write_log.info("QUALITY_UPGRADE_SCAN", "Scanning completed tracks for quality upgrade opportunities.")
 
-    # Get all completed tracks
-    completed_tracks = track_db.get_tracks_by_status("completed")
+    # Get all completed tracks with their file quality in one query
+    completed_tracks = _get_track_db().get_completed_tracks_with_quality()
 
     if not completed_tracks:
         write_log.debug("QUALITY_UPGRADE_NO_COMPLETED", "No completed tracks found to check for upgrades.")
@@ -573,36 +925,12 @@ def mark_tracks_for_quality_upgrade() -> None:
         f"Checking {len(completed_tracks)} completed tracks for upgrade eligibility.",
     )
 
-    upgrade_count = 0
-
-    for track_row in completed_tracks:
-        track_id = track_row[0]  # First column is track_id
-
-        # Get current file properties
-        current_extension = track_db.get_track_extension(track_id)
-        current_bitrate = track_db.get_track_bitrate(track_id)
-
-        # Determine if track meets quality requirements
-        meets_requirements = False
-
-        if PREFER_MP3:
-            # Target: MP3 320kbps
-            if all([
-                current_extension,
-                current_extension.lower() == "mp3",
-                current_bitrate,
-                current_bitrate >= MIN_BITRATE_KBPS
-            ]):
-                # MP3 file: check if it's high quality (320kbps)
-                meets_requirements = True
-        # Target: WAV (lossless)
-        elif current_extension and current_extension.lower() == "wav":
-            meets_requirements = True
+    upgrade_ids = []
 
+    for track_id, current_extension, current_bitrate in completed_tracks:
         # Mark for upgrade if doesn't meet requirements
-        if not meets_requirements:
-            track_db.update_track_status(track_id, "redownload_pending")
-            upgrade_count += 1
+        if not _meets_quality_target(current_extension, current_bitrate):
+            upgrade_ids.append(track_id)
             write_log.debug(
                 "QUALITY_UPGRADE_MARKED",
                 "Marked track for quality upgrade.",
@@ -613,6 +941,9 @@ def mark_tracks_for_quality_upgrade() -> None:
                 },
             )
 
+    _get_track_db().update_tracks_status_bulk(upgrade_ids, "redownload_pending")
+    upgrade_count = len(upgrade_ids)
+
     if upgrade_count > 0:
         target = "MP3 320kbps" if PREFER_MP3 else "WAV"
         write_log.info(
@@ -628,7 +959,11 @@ def mark_tracks_for_quality_upgrade() -> None:
         )
 
 
-def _update_file_status(file: dict, username: str | None = None) -> None:
+def _update_file_status(
+    file: dict,
+    username: str | None = None,
+    batch: "_DownloadSyncBatch | None" = None,
+) -> None:
     """Update database status for a single download file.
 
     Maps slskd file states to database status values and updates accordingly.
@@ -638,67 +973,120 @@ def _update_file_status(file: dict, username: str | None = None) -> None:
     Args:
         file: File object from slskd API containing id, state, filename
         username: Soulseek username the download is from (used for removing failed downloads)
+        batch: If given, the track ID is looked up in its prefetched UUID map, and
+            failed/queued/in-progress statuses plus remuxes and M3U8 updates for completed
+            downloads are queued here instead of being applied inline
+            (see update_download_statuses)
 
     """
     slskd_uuid = file.get("id")
-    track_id = track_db.get_track_id_by_slskd_download_uuid(slskd_uuid)
-    download_username = username or track_db.get_username_by_slskd_uuid(slskd_uuid)
+    if batch is not None:
+        track_id = batch.track_ids_by_uuid.get(slskd_uuid)
+    else:
+        track_id = _get_track_db().get_track_id_by_slskd_download_uuid(slskd_uuid)
+
+    state = file.get("state")
+    new_status = _DOWNLOAD_STATE_STATUS.get(state)
+
+    if batch is not None:
+        outcome = "completed" if state == "Completed, Succeeded" else new_status or "other"
+        batch.status_counts[outcome if track_id else "unmatched"] += 1
 
     if not track_id:
         write_log.debug("SLSKD_UUID_UNKNOWN", "No track ID found for slskd UUID.",
                        {"slskd_uuid": slskd_uuid})
         return
 
-    state = file.get("state")
+    download_username = username or _get_track_db().get_username_by_slskd_uuid(slskd_uuid)
     write_log.debug("FILE_STATUS_UPDATE", "Updating file status.",
                    {"track_id": track_id, "state": state})
 
-    # Define failed states for comparison
-    failed_states = (
-        "Completed, Errored", "Completed, TimedOut", "Completed, Cancelled",
-        "Completed, Rejected", "Completed, Aborted",
-    )
+    if batch is not None:
+        # A later record of the same track supersedes any status queued for it earlier
+        batch.status_updates.pop(track_id, None)
 
     # Handle successful downloads
     if state == "Completed, Succeeded":
-        _handle_completed_download(file, track_id)
+        if _handle_completed_download(file, track_id, download_username, batch):
+            # Remux deferred - the slskd record is removed once it has finished
+            return
 
     # Handle failed downloads - remove from slskd to prevent duplicate logs
-    elif state in failed_states:
+    elif new_status == "failed":
         failed_reason = (
             file.get("error")
             or file.get("errorMessage")
             or file.get("message")
             or state
         )
-        track_db.update_track_status(track_id, "failed", failed_reason=failed_reason)
+        _set_download_status(track_id, "failed", batch, failed_reason)
         write_log.info(
             "DOWNLOAD_FAILED",
             "Download failed.",
             {"track_id": track_id, "state": state, "failed_reason": failed_reason},
         )
 
-    # Handle queued downloads
-    elif state == "Queued, Remotely":
-        track_db.update_track_status(track_id, "queued")
-
-    # Handle in-progress downloads
-    elif state == "InProgress":
-        track_db.update_track_status(track_id, "downloading")
+    # Handle queued and in-progress downloads
+    elif new_status:
+        _set_download_status(track_id, new_status, batch)
 
     # Handle unknown states
     else:
-        normalized_state = state.lower().replace(" ", "_").replace(",", "")
-        track_db.update_track_status(track_id, normalized_state)
+        _set_download_status(track_id, _normalize_download_state(state), batch)
         write_log.debug("DOWNLOAD_STATE_UNKNOWN", "Unknown download state encountered.",
                        {"track_id": track_id, "state": state})
 
     if state.startswith("Completed"):
-        if download_username and slskd_uuid:
-            remove_download_from_slskd(download_username, slskd_uuid)
+        _remove_finished_download(
+            track_id, slskd_uuid, download_username, batch.removals if batch is not None else None,
+        )
+
+
+def _set_download_status(
+    track_id: str,
+    status: str,
+    batch: "_DownloadSyncBatch | None",
+    failed_reason: str | None = None,
+) -> None:
+    """Store a download status, queued on the batch when there is one."""
+    if batch is not None:
+        batch.status_updates[track_id] = (status, failed_reason)
+    else:
+        _get_track_db().update_track_status(track_id, status, failed_reason=failed_reason)
+
+
+@functools.cache
+def _normalize_download_state(state: str) -> str:
+    """Turn an unmapped slskd state into a status value, e.g. "Queued, Locally" -> "queued_locally".
+
+    slskd only reports a handful of distinct states, so results are memoized.
+    """
+    return state.lower().replace(" ", "_").replace(",", "")
+
+
+def _remove_finished_download(
+    track_id: str,
+    slskd_uuid: str | None,
+    username: str | None,
+    removals: dict[str, set[str]] | None = None,
+) -> None:
+    """Remove a finished download record from slskd so it is not processed again.
+
+    Args:
+        track_id: Track identifier (for logging)
+        slskd_uuid: slskd download UUID
+        username: Soulseek username the download is from
+        removals: If given, the removal is queued here (username -> UUIDs) instead of sent immediately
+
+    """
+    if username and slskd_uuid:
+        if removals is not None:
+            removals.setdefault(username, set()).add(slskd_uuid)
         else:
-            write_log.warn("DOWNLOAD_REMOVE_SKIP", "Cannot remove failed download - missing username or UUID.",
-                            {"track_id": track_id, "slskd_uuid": slskd_uuid, "username": download_username})
+            remove_download_from_slskd(username, slskd_uuid)
+    else:
+        write_log.warn("DOWNLOAD_REMOVE_SKIP", "Cannot remove failed download - missing username or UUID.",
+                        {"track_id": track_id, "slskd_uuid": slskd_uuid, "username": username})
 
 
 def _should_skip_completed_download(track_id: str) -> bool:
@@ -714,7 +1102,7 @@ def _should_skip_completed_download(track_id: str) -> bool:
         True if the download should be skipped, False otherwise
 
     """
-    current_status = track_db.get_track_status(track_id)
+    current_status = _get_track_db().get_track_status(track_id)
     if current_status == "redownload_pending":
         write_log.debug("DOWNLOAD_SKIP_REDOWNLOAD", "Skipping status update for track marked for redownload.",
                        {"track_id": track_id})
@@ -750,20 +1138,26 @@ def _compute_download_local_path(file: dict) -> str | None:
     if not filename_rel:
         return None
 
-    normalized_path = filename_rel.replace("\\", "/")
-    path_parts = normalized_path.split("/")
-
-    if len(path_parts) >= 2:  # noqa: PLR2004
-        relative_path = "/".join(path_parts[-2:])
-    elif len(path_parts) == 1:
-        relative_path = path_parts[0]
-    else:
-        relative_path = filename_rel
+    # Keep only the parent folder and filename; rsplit stops after the last two separators
+    relative_path = "/".join(filename_rel.replace("\\", "/").rsplit("/", 2)[-2:])
 
     return os.path.join(config.downloads_root, relative_path)
 
 
-def _is_duplicate_record(track_id: str, local_file_path: str) -> bool:
+def _duplicate_record_key(path: str) -> str:
+    """Return the case-insensitive file name used to recognise an already-tracked download.
+
+    A file counts as already tracked when its name matches regardless of folder,
+    separator style or case.
+    """
+    return path.replace("\\", "/").rsplit("/", 1)[-1].casefold()
+
+
+def _is_duplicate_record(
+    track_id: str,
+    local_file_path: str,
+    existing_keys: dict[str, str] | None = None,
+) -> bool:
     """Check if a download is a duplicate record (same file already tracked).
 
     Prevents reprocessing old slskd records that appear after quality upgrade
@@ -772,25 +1166,27 @@ def _is_duplicate_record(track_id: str, local_file_path: str) -> bool:
     Args:
         track_id: Track identifier
         local_file_path: Path to the newly downloaded file
+        existing_keys: Prefetched track ID -> _duplicate_record_key() of its tracked file;
+            queried from the database if omitted
 
     Returns:
         True if this file is already tracked in the database, False otherwise
 
     """
-    existing_path = track_db.get_local_file_path(track_id)
-    if not existing_path:
+    if existing_keys is not None:
+        existing_key = existing_keys.get(track_id)
+    else:
+        existing_path = _get_track_db().get_local_file_path(track_id)
+        existing_key = _duplicate_record_key(existing_path) if existing_path else None
+    if not existing_key:
         return False
 
-    existing_normalized = existing_path.replace("\\", "/").lower()
-    new_normalized = local_file_path.replace("\\", "/").lower()
-    paths_match = (
-        existing_normalized == new_normalized
-        or os.path.basename(existing_normalized) == os.path.basename(new_normalized)
-    )
-    if paths_match:
-        write_log.debug("DOWNLOAD_DUPLICATE_RECORD", "Skipping old slskd record - file already tracked.",
-                       {"track_id": track_id, "existing_path": existing_path, "slskd_path": local_file_path})
-    return paths_match
+    if existing_key != _duplicate_record_key(local_file_path):
+        return False
+
+    write_log.debug("DOWNLOAD_DUPLICATE_RECORD", "Skipping old slskd record - file already tracked.",
+                   {"track_id": track_id, "existing_file": existing_key, "slskd_path": local_file_path})
+    return True
 
 
 def _extract_extension_bitrate(file: dict, local_file_path: str) -> tuple[str | None, int | None]:
@@ -842,26 +1238,154 @@ def _remux_completed_download(track_id: str, local_file_path: str, extension: st
         Final file path after remuxing (may be same as input if no remux needed)
 
     """
-    # Exclude 'wav' from lossless set - already in target format
-    lossless_to_remux = LOSSLESS_FORMATS - {"wav"}
-    final_path = local_file_path
+    target_ext = _completed_download_remux_target(extension)
+    if target_ext:
+        return _remux_to_target(local_file_path, track_id, extension, target_ext)
 
-    if PREFER_MP3:
-        if extension in lossless_to_remux or extension in LOSSY_FORMATS or extension == "wav":
-            final_path = _remux_lossy_to_mp3(local_file_path, track_id, extension) or local_file_path
-    elif extension in lossless_to_remux:
-        final_path = _remux_lossless_to_wav(local_file_path, track_id, extension) or local_file_path
-    elif extension in LOSSY_FORMATS:
-        final_path = _remux_lossy_to_mp3(local_file_path, track_id, extension) or local_file_path
-    elif extension == "mp3":
-        track_db.update_extension_bitrate(track_id, extension="mp3", bitrate=bitrate)
-    elif extension == "wav":
-        track_db.update_extension_bitrate(track_id, extension="wav", bitrate=None)
+    if not PREFER_MP3:
+        if extension == "mp3":
+            _get_track_db().update_extension_bitrate(track_id, extension="mp3", bitrate=bitrate)
+        elif extension == "wav":
+            _get_track_db().update_extension_bitrate(track_id, extension="wav", bitrate=None)
+
+    return local_file_path
+
+
+def _completed_download_remux_target(extension: str | None) -> str | None:
+    """Return the format a completed download should be remuxed to.
+
+    Args:
+        extension: File extension (lowercase)
+
+    Returns:
+        "wav" or "mp3", or None if the file is already in the preferred format
+
+    """
+    # Unknown formats are left as downloaded
+    return _REMUX_TARGET_BY_EXTENSION.get(extension)
+
+
+@dataclass
+class _PendingRemux:
+    """A completed download whose remux is deferred so it can run in parallel with others."""
+
+    local_file_path: str
+    extension: str
+    target_ext: str
+    slskd_uuid: str | None
+    username: str | None
 
-    return final_path
 
+@dataclass
+class _DownloadSyncBatch:
+    """Work collected during one update_download_statuses() sweep and applied after the scan."""
 
-def _handle_completed_download(file: dict, track_id: str) -> None:
+    # slskd download UUID -> track ID, prefetched for every file in the sweep
+    track_ids_by_uuid: dict[str, str] = field(default_factory=dict)
+    # Track ID -> _duplicate_record_key() of its tracked file at the start of the sweep
+    duplicate_keys_by_track: dict[str, str] = field(default_factory=dict)
+    # Deferred remuxes keyed by track ID
+    remuxes: dict[str, _PendingRemux] = field(default_factory=dict)
+    # Track ID -> (status, failed_reason) of failed/queued/in-progress files, written in bulk
+    # by _write_status_updates()
+    status_updates: dict[str, tuple[str, str | None]] = field(default_factory=dict)
+    # M3U8 path -> {track_id: local_file_path}
+    m3u8_updates: dict[str, dict[str, str]] = field(default_factory=dict)
+    # Finished slskd downloads to remove after the sweep: username -> download UUIDs
+    removals: dict[str, set[str]] = field(default_factory=dict)
+    # Files seen per outcome (completed/failed/queued/downloading/other/unmatched), logged once per sweep
+    status_counts: Counter[str] = field(default_factory=Counter)
+
+
+def _remux_worker_count(job_count: int) -> int:
+    """Return how many FFmpeg remuxes to run at once for job_count jobs."""
+    return max(1, min(job_count, REMUX_MAX_WORKERS or os.cpu_count() or 1))
+
+
+def _ffmpeg_thread_count(worker_count: int) -> int:
+    """Return the -threads value for each FFmpeg process when worker_count run at once.
+
+    Splits the cores between the concurrent processes so a full pool doesn't oversubscribe
+    the CPU, while a single remux can still use every core.
+    """
+    return max(1, (os.cpu_count() or 1) // worker_count)
+
+
+def _run_pending_remuxes(batch: _DownloadSyncBatch) -> None:
+    """Remux queued completed downloads in parallel and finish each one as it completes.
+
+    Each remux is its own FFmpeg process, so worker threads are enough to keep every
+    core busy. Database, M3U8 and slskd updates stay on the calling thread because
+    TrackDB shares a single SQLite connection.
+
+    Args:
+        batch: Sync batch holding the deferred remuxes; M3U8 updates are added to it
+
+    """
+    pending_remuxes = batch.remuxes
+    if not pending_remuxes:
+        return
+
+    max_workers = _remux_worker_count(len(pending_remuxes))
+    write_log.debug("REMUX_BATCH_START", "Remuxing completed downloads in parallel.",
+                   {"count": len(pending_remuxes), "workers": max_workers})
+
+    threads = _ffmpeg_thread_count(max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _run_remux_job, job.local_file_path, track_id, job.extension, job.target_ext, threads,
+            ): track_id
+            for track_id, job in pending_remuxes.items()
+        }
+        for future in as_completed(futures):
+            track_id = futures[future]
+            job = pending_remuxes[track_id]
+            final_path = _apply_remux_result(
+                job.local_file_path, track_id, job.extension, job.target_ext, future.result(),
+            )
+            _finalize_completed_download(track_id, final_path, batch.m3u8_updates, batch.removals)
+            _remove_finished_download(track_id, job.slskd_uuid, job.username, batch.removals)
+
+
+def _write_status_updates(status_updates: dict[str, tuple[str, str | None]]) -> None:
+    """Write queued track statuses with one bulk update per distinct status, in one transaction.
+
+    Args:
+        status_updates: Mapping of track ID to its new (status, failed_reason)
+
+    """
+    failed_reasons: dict[str, str | None] = {}
+    track_ids_by_status: defaultdict[str, list[str]] = defaultdict(list)
+    for track_id, (status, failed_reason) in status_updates.items():
+        if status == "failed":
+            failed_reasons[track_id] = failed_reason
+        else:
+            track_ids_by_status[status].append(track_id)
+    track_db = _get_track_db()
+    with track_db.transaction():
+        track_db.mark_tracks_failed_bulk(failed_reasons)
+        for status, track_ids in track_ids_by_status.items():
+            track_db.update_tracks_status_bulk(track_ids, status)
+
+
+def _write_m3u8_updates(m3u8_updates: dict[str, dict[str, str]]) -> None:
+    """Apply queued M3U8 updates, rewriting each playlist file once.
+
+    Args:
+        m3u8_updates: Mapping of M3U8 path to {track_id: local_file_path}
+
+    """
+    for m3u8_path, local_file_paths in m3u8_updates.items():
+        update_tracks_in_m3u8(m3u8_path, local_file_paths)
+
+
+def _handle_completed_download(
+    file: dict,
+    track_id: str,
+    username: str | None = None,
+    batch: _DownloadSyncBatch | None = None,
+) -> bool:
     """Process a successfully completed download.
 
     This function:
@@ -869,33 +1393,74 @@ def _handle_completed_download(file: dict, track_id: str) -> None:
     2. Extracts the file path from slskd response
     3. Constructs the local file path
     4. Checks if this is an old slskd record being reprocessed (same file already tracked)
-    5. Updates the database with the local file path
-    6. Updates all M3U8 files that contain this track
-    7. Removes any ongoing searches and downloads from slskd
+    5. Remuxes the file to the preferred format, or queues the remux in batch
+    6. Finalizes the track via _finalize_completed_download()
 
     Args:
         file: File object from slskd API
         track_id: Track identifier
+        username: Soulseek username the download is from
+        batch: If given, the remux and M3U8 updates are queued here instead of
+            being applied inline
+
+    Returns:
+        True if the remux was queued (finalization is deferred), False otherwise
 
     """
+    if batch is not None and track_id in batch.remuxes:
+        return True
+
     if _should_skip_completed_download(track_id):
-        return
+        return False
 
     local_file_path = _compute_download_local_path(file)
     if not local_file_path:
         write_log.warn("DOWNLOAD_NO_FILENAME", "Completed download has no filename.",
                       {"track_id": track_id})
-        track_db.update_track_status(track_id, "completed")
-        return
+        _get_track_db().update_track_status(track_id, "completed")
+        return False
 
-    if _is_duplicate_record(track_id, local_file_path):
-        return
+    if _is_duplicate_record(track_id, local_file_path, batch.duplicate_keys_by_track if batch is not None else None):
+        return False
 
     extension, bitrate = _extract_extension_bitrate(file, local_file_path)
+
+    target_ext = _completed_download_remux_target(extension)
+    if batch is not None and extension and target_ext:
+        batch.remuxes[track_id] = _PendingRemux(local_file_path, extension, target_ext, file.get("id"), username)
+        return True
+
     final_path = _remux_completed_download(track_id, local_file_path, extension, bitrate)
+    if batch is not None:
+        _finalize_completed_download(track_id, final_path, batch.m3u8_updates, batch.removals)
+    else:
+        _finalize_completed_download(track_id, final_path)
+    return False
+
 
+def _finalize_completed_download(
+    track_id: str,
+    final_path: str,
+    m3u8_updates: dict[str, dict[str, str]] | None = None,
+    removals: dict[str, set[str]] | None = None,
+) -> None:
+    """Record a remuxed download as completed.
+
+    This function:
+    1. Skips tracks whose remux flagged the file as corrupt
+    2. Updates the database with the local file path
+    3. Updates all M3U8 files that contain this track
+    4. Removes any ongoing searches and downloads from slskd
+
+    Args:
+        track_id: Track identifier
+        final_path: Path to the file after remuxing
+        m3u8_updates: If given, M3U8 updates are queued here instead of written immediately
+        removals: If given, the slskd download removal is queued here instead of sent immediately
+
+    """
     # Check if remux failed and status was set to "failed" due to corruption detection
-    current_status = track_db.get_track_status(track_id)
+    current_status = _get_track_db().get_track_status(track_id)
     if current_status == "failed":
         write_log.debug(
             "DOWNLOAD_SKIPPED_REDOWNLOAD",
@@ -904,8 +1469,8 @@ def _handle_completed_download(file: dict, track_id: str) -> None:
         )
         return
 
-    existing_path = track_db.get_local_file_path(track_id)
-    track_db.update_local_file_path(track_id, final_path)
+    existing_path = _get_track_db().get_local_file_path(track_id)
+    _get_track_db().update_local_file_path(track_id, final_path)
 
     write_log.debug(
         "DOWNLOAD_COMPLETE",
@@ -916,42 +1481,24 @@ def _handle_completed_download(file: dict, track_id: str) -> None:
             "is_new": not bool(existing_path),
         },
     )
-    _update_m3u8_files_for_track(track_id, final_path)
+    _update_m3u8_files_for_track(track_id, final_path, m3u8_updates)
 
     # Clean up any ongoing searches and downloads in slskd
-    search_uuid = track_db.get_search_uuid_by_track_id(track_id)
+    search_uuid = _get_track_db().get_search_uuid_by_track_id(track_id)
     if search_uuid:
         remove_search_from_slskd(search_uuid, track_id)
         write_log.debug("IMPORT_SEARCH_REMOVED", "Removed ongoing search from slskd.",
                       {"track_id": track_id, "search_uuid": search_uuid})
 
-    download_uuid = track_db.get_download_uuid_by_track_id(track_id)
+    download_uuid = _get_track_db().get_download_uuid_by_track_id(track_id)
     if download_uuid:
-        username = track_db.get_username_by_slskd_uuid(download_uuid)
+        username = _get_track_db().get_username_by_slskd_uuid(download_uuid)
         if username:
-            remove_download_from_slskd(username, download_uuid)
+            _remove_finished_download(track_id, download_uuid, username, removals)
             write_log.debug("IMPORT_DOWNLOAD_REMOVED", "Removed download from slskd.",
                           {"track_id": track_id, "download_uuid": download_uuid, "username": username})
 
-    track_db.update_track_status(track_id, "completed")
-
-def _is_audio_valid(audio_path: str) -> bool:
-    """Use ffmpeg to check if an audio file is valid and decodable.
-    Returns True if valid, False otherwise.
-    """
-    try:
-        result = subprocess.run([
-            "ffmpeg", "-v", "error", "-i", audio_path, "-f", "null", "-",
-        ], check=False, capture_output=True, text=True)
-        return result.returncode == 0
-    except Exception as e:
-        write_log.error(
-            "AUDIO_CHECK_FAIL",
-            "Failed to check audio file integrity.",
-            {"audio_path": audio_path, "error": str(e)},
-        )
-        return False
-
+    _get_track_db().update_track_status(track_id, "completed")
 
 def _get_ffmpeg_log_path() -> str:
     """Get the path for the FFmpeg remux log file.
@@ -962,42 +1509,77 @@ def _get_ffmpeg_log_path() -> str:
         Absolute path to ffmpeg_remux.log
 
     """
-    base_dir = os.path.dirname(os.path.dirname(__file__))
-    logs_dir = os.path.join(base_dir, "observability", "logs", ENV)
-    now = datetime.now()
-    dated_logs_dir = os.path.join(
-        logs_dir,
-        now.strftime("%Y"),
-        now.strftime("%m"),
-        now.strftime("%d"),
-    )
+    return _ffmpeg_log_path_for_day(date.today())
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_log_path_for_day(day: date) -> str:
+    """Build (and create the directory for) the FFmpeg log path of one day.
+
+    Cached so the directory is only created when the date changes, not on every remux.
+    """
+    dated_logs_dir = os.path.join(config.logs_dir, f"{day:%Y}", f"{day:%m}", f"{day:%d}")
     os.makedirs(dated_logs_dir, exist_ok=True)
     return os.path.join(dated_logs_dir, "ffmpeg_remux.log")
 
 
+def _get_ffmpeg_log_file() -> TextIO:
+    """Return the open FFmpeg log of the current day, reopening it when the date changes.
+
+    The file stays open between remuxes instead of being reopened for every run.
+    Must be called with _FFMPEG_LOG_LOCK held.
+    """
+    global _ffmpeg_log  # noqa: PLW0603
+    ffmpeg_log_path = _get_ffmpeg_log_path()
+    if _ffmpeg_log is None or _ffmpeg_log[0] != ffmpeg_log_path:
+        if _ffmpeg_log is not None:
+            _ffmpeg_log[1].close()
+        _ffmpeg_log = (ffmpeg_log_path, open(ffmpeg_log_path, "a", encoding="utf-8"))  # noqa: SIM115
+    return _ffmpeg_log[1]
+
+
 def _run_ffmpeg_remux(
     input_path: str,
     output_path: str,
     ffmpeg_args: list[str],
     log_context: dict[str, str],
+    threads: int = 0,
 ) -> bool:
     """Run FFmpeg to remux an audio file with logging.
 
+    Runs with -xerror so any decode error aborts with a non-zero exit status; the
+    remux doubles as the integrity check and no separate decode pass is needed.
+
     Args:
-        input_path: Path to input file (already normalized with forward slashes)
-        output_path: Path to output file (already normalized with forward slashes)
+        input_path: Path to input file (native separators are fine for FFmpeg)
+        output_path: Path to output file
         ffmpeg_args: FFmpeg codec arguments (e.g., ["-codec:a", "pcm_s16le", "-ar", "44100"])
         log_context: Dict with 'track_id', 'source_ext', 'target_ext' for logging
+        threads: FFmpeg -threads value (0 = let FFmpeg decide)
 
     Returns:
-        True if remux succeeded, False otherwise
+        True if remux succeeded
+
+    Raises:
+        subprocess.CalledProcessError: If FFmpeg fails (e.g. the input is corrupt); its
+            output attribute holds the FFmpeg log of the run
 
     """
     track_id = log_context["track_id"]
     source_ext = log_context["source_ext"]
     target_ext = log_context["target_ext"]
 
-    ffmpeg_cmd = ["ffmpeg", "-y", "-i", input_path, *ffmpeg_args, output_path]
+    # FFmpeg writes to a temporary name that is renamed into place on success, so an
+    # interrupted or failed run never leaves a truncated file under the final name
+    output_root, output_suffix = os.path.splitext(output_path)
+    temp_output_path = f"{output_root}.part{output_suffix}"
+
+    # The banner and progress stats are noise in the shared log; the corruption markers
+    # checked on failure are all reported at error level
+    ffmpeg_cmd = [
+        "ffmpeg", "-hide_banner", "-nostdin", "-nostats", "-loglevel", FFMPEG_LOGLEVEL, "-y", "-xerror",
+        "-i", input_path, *ffmpeg_args, "-threads", str(threads), temp_output_path,
+    ]
     ffmpeg_log_file = _get_ffmpeg_log_path()
     now = datetime.now()
 
@@ -1007,13 +1589,25 @@ def _run_ffmpeg_remux(
         {"input": input_path, "output": output_path, "ffmpeg_log_file": ffmpeg_log_file},
     )
 
-    with open(ffmpeg_log_file, "a", encoding="utf-8") as logf:
+    with _FFMPEG_SLOTS:
+        result = subprocess.run(
+            ffmpeg_cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace",
+        )
+
+    # Remuxes may run concurrently - write each run as one block so the log stays readable
+    with _FFMPEG_LOG_LOCK:
+        logf = _get_ffmpeg_log_file()
         logf.write(
             f"\n--- Remux {now.strftime('%Y-%m-%d %H:%M:%S')} "
             f"| Track ID: {track_id} | Input: {input_path} | Output: {output_path} ---\n",
         )
-        subprocess.run(ffmpeg_cmd, check=True, stdout=logf, stderr=subprocess.STDOUT)
+        logf.write(result.stdout)
+        logf.flush()
 
+    if result.returncode:
+        _remove_partial_output(temp_output_path, track_id)
+    result.check_returncode()
+    os.replace(temp_output_path, output_path)
     return True
 
 
@@ -1027,7 +1621,7 @@ def _cleanup_original_file(original_path: str, new_path: str, track_id: str, ext
         extension: Original file extension for logging
 
     """
-    if not os.path.exists(original_path) or original_path == new_path:
+    if original_path == new_path:
         return
 
     try:
@@ -1037,6 +1631,9 @@ def _cleanup_original_file(original_path: str, new_path: str, track_id: str, ext
             f"Deleted original {extension.upper()} file after remuxing.",
             {"track_id": track_id, "removed_file": original_path},
         )
+    except FileNotFoundError:
+        # Already gone - nothing to clean up
+        pass
     except Exception as e:
         write_log.warn(
             "ORIGINAL_FILE_DELETE_FAILED",
@@ -1045,6 +1642,25 @@ def _cleanup_original_file(original_path: str, new_path: str, track_id: str, ext
         )
 
 
+def _remove_partial_output(output_path: str, track_id: str) -> None:
+    """Remove a partially written remux output left behind by a failed FFmpeg run.
+
+    Args:
+        output_path: Path to the remux output file
+        track_id: Track identifier for logging
+
+    """
+    try:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+    except OSError as e:
+        write_log.warn(
+            "REMUX_PARTIAL_DELETE_FAILED",
+            "Failed to delete partial remux output.",
+            {"track_id": track_id, "file_path": output_path, "error": str(e)},
+        )
+
+
 def _handle_corrupt_audio(track_id: str, file_path: str, extension: str, is_lossless: bool) -> None:
     """Handle corrupt audio file by updating status and blacklisting.
 
@@ -1064,13 +1680,13 @@ def _handle_corrupt_audio(track_id: str, file_path: str, extension: str, is_loss
         f"{'Lossless' if is_lossless else 'Lossy'} file failed integrity check. Marking for redownload.",
         {"track_id": track_id, "file_path": file_path, "extension": extension},
     )
-    track_db.update_track_status(track_id, "failed", failed_reason="corrupt_file")
+    _get_track_db().update_track_status(track_id, "failed", failed_reason="corrupt_file")
 
     # Blacklist based on username + slskd_file_name instead of UUID
-    username = track_db.get_username_by_track_id(track_id)
-    slskd_file_name = track_db.get_slskd_file_name_by_track_id(track_id)
+    username = _get_track_db().get_username_by_track_id(track_id)
+    slskd_file_name = _get_track_db().get_slskd_file_name_by_track_id(track_id)
     if username and slskd_file_name:
-        track_db.add_slskd_blacklist(username, slskd_file_name, reason=f"corrupt_{extension}")
+        _get_track_db().add_slskd_blacklist(username, slskd_file_name, reason=f"corrupt_{extension}")
     else:
         write_log.warn(
             "BLACKLIST_SKIP",
@@ -1084,86 +1700,114 @@ def _handle_corrupt_audio(track_id: str, file_path: str, extension: str, is_loss
         )
 
 
-def _remux_lossless_to_wav(local_file_path: str, track_id: str, extension: str) -> str:
-    """Remux a lossless audio file (FLAC, ALAC, APE) to WAV.
-    Update extension/bitrate in DB if successful.
-    Returns the new WAV path if successful, else original path.
+def _run_remux_job(
+    local_file_path: str,
+    track_id: str,
+    extension: str,
+    target_ext: str,
+    threads: int = 0,
+) -> Exception | None:
+    """Run the FFmpeg step of a remux without touching the database.
+
+    Safe to call from a worker thread; pass the result to _apply_remux_result()
+    on the main thread.
+
+    Args:
+        local_file_path: Path to the file to remux
+        track_id: Track identifier for logging
+        extension: Current file extension
+        target_ext: Target format ("wav" or "mp3")
+        threads: FFmpeg -threads value (0 = let FFmpeg decide)
+
+    Returns:
+        The exception raised by FFmpeg, or None if the remux succeeded
+
     """
-    wav_path = os.path.splitext(local_file_path)[0] + ".wav"
-    ffmpeg_input = local_file_path.replace("\\", "/")
-    ffmpeg_output = wav_path.replace("\\", "/")
+    output_path = os.path.splitext(local_file_path)[0] + f".{target_ext}"
+    ffmpeg_args, _, _ = _REMUX_TARGETS[target_ext]
+    log_context = {"track_id": track_id, "source_ext": extension, "target_ext": target_ext}
 
     try:
-        # Check audio integrity before remuxing
-        if not _is_audio_valid(ffmpeg_input):
-            _handle_corrupt_audio(track_id, ffmpeg_input, extension, is_lossless=True)
-            return local_file_path
+        _run_ffmpeg_remux(local_file_path, output_path, ffmpeg_args, log_context, threads)
+    except Exception as e:
+        return e
+    return None
+
+
+def _apply_remux_result(
+    local_file_path: str,
+    track_id: str,
+    extension: str,
+    target_ext: str,
+    error: Exception | None,
+) -> str:
+    """Record the outcome of a remux in the DB and clean up files.
+
+    Updates extension/bitrate in DB and removes the original if successful.
+    Corrupt input (FFmpeg exits non-zero reporting damaged data) marks the track
+    for redownload; other FFmpeg failures leave the original file in place.
+    Returns the new path if successful, else original path.
+    """
+    output_path = os.path.splitext(local_file_path)[0] + f".{target_ext}"
+    _, bitrate, label = _REMUX_TARGETS[target_ext]
 
-        # Remux to WAV (16-bit, 44.1kHz)
-        ffmpeg_args = ["-codec:a", "pcm_s16le", "-ar", "44100"]
-        log_context = {"track_id": track_id, "source_ext": extension, "target_ext": "wav"}
-        _run_ffmpeg_remux(ffmpeg_input, ffmpeg_output, ffmpeg_args, log_context)
+    try:
+        if error is not None:
+            raise error
 
-        track_db.update_extension_bitrate(track_id, extension="wav", bitrate=None)
+        _get_track_db().update_extension_bitrate(track_id, extension=target_ext, bitrate=bitrate)
         write_log.debug(
             "REMUX_SUCCESS",
-            f"{extension.upper()} remuxed to WAV.",
-            {"track_id": track_id, "wav_path": wav_path},
+            f"{extension.upper()} remuxed to {label}.",
+            {"track_id": track_id, f"{target_ext}_path": output_path},
         )
 
-        _cleanup_original_file(local_file_path, wav_path, track_id, extension)
-        return wav_path
+        _cleanup_original_file(local_file_path, output_path, track_id, extension)
+        return output_path
+
+    except subprocess.CalledProcessError as e:
+        # -xerror makes FFmpeg exit non-zero on any decode error
+        if not _is_corrupt_input_error(e):
+            write_log.error(
+                "REMUX_FAIL",
+                f"FFmpeg failed to remux {extension.upper()} to {target_ext.upper()}.",
+                {"track_id": track_id, "returncode": e.returncode, "output_tail": (e.output or "")[-500:]},
+            )
+            _get_track_db().update_extension_bitrate(track_id, extension=extension)
+            return local_file_path
+        _handle_corrupt_audio(track_id, local_file_path, extension, is_lossless=target_ext == "wav")
+        return local_file_path
 
     except Exception as e:
         write_log.error(
             "REMUX_FAIL",
-            f"Failed to remux {extension.upper()} to WAV.",
+            f"Failed to remux {extension.upper()} to {target_ext.upper()}.",
             {"track_id": track_id, "error": str(e)},
         )
-        track_db.update_extension_bitrate(track_id, extension=extension)
+        _get_track_db().update_extension_bitrate(track_id, extension=extension)
         return local_file_path
 
 
-def _remux_lossy_to_mp3(local_file_path: str, track_id: str, extension: str) -> str:
-    """Remux a lossy audio file (OGG, M4A, AAC, WMA, OPUS) to MP3 320kbps.
-    Update extension/bitrate in DB if successful.
-    Returns the new MP3 path if successful, else original path.
-    """
-    mp3_path = os.path.splitext(local_file_path)[0] + ".mp3"
-    ffmpeg_input = local_file_path.replace("\\", "/")
-    ffmpeg_output = mp3_path.replace("\\", "/")
-
-    try:
-        # Check audio integrity before remuxing
-        if not _is_audio_valid(ffmpeg_input):
-            _handle_corrupt_audio(track_id, ffmpeg_input, extension, is_lossless=False)
-            return local_file_path
+def _is_corrupt_input_error(error: subprocess.CalledProcessError) -> bool:
+    """Check whether a failed FFmpeg run reported damaged input (see _FFMPEG_CORRUPTION_MARKERS)."""
+    output = (error.output or "").lower()
+    return any(marker in output for marker in _FFMPEG_CORRUPTION_MARKERS)
 
-        # Remux to MP3 320kbps
-        ffmpeg_args = ["-codec:a", "libmp3lame", "-b:a", "320k"]
-        log_context = {"track_id": track_id, "source_ext": extension, "target_ext": "mp3"}
-        _run_ffmpeg_remux(ffmpeg_input, ffmpeg_output, ffmpeg_args, log_context)
 
-        track_db.update_extension_bitrate(track_id, extension="mp3", bitrate=320)
-        write_log.debug(
-            "REMUX_SUCCESS",
-            f"{extension.upper()} remuxed to MP3 320kbps.",
-            {"track_id": track_id, "mp3_path": mp3_path},
-        )
+def _remux_to_target(local_file_path: str, track_id: str, extension: str, target_ext: str) -> str:
+    """Remux a file to the target format and record the result.
 
-        _cleanup_original_file(local_file_path, mp3_path, track_id, extension)
-        return mp3_path
+    Returns the new path if successful, else original path.
+    """
+    error = _run_remux_job(local_file_path, track_id, extension, target_ext, _ffmpeg_thread_count(1))
+    return _apply_remux_result(local_file_path, track_id, extension, target_ext, error)
 
-    except Exception as e:
-        write_log.error(
-            "REMUX_FAIL",
-            f"Failed to remux {extension.upper()} to MP3.",
-            {"track_id": track_id, "error": str(e)},
-        )
-        track_db.update_extension_bitrate(track_id, extension=extension)
-        return local_file_path
 
-def _update_m3u8_files_for_track(track_id: str, local_file_path: str) -> None:
+def _update_m3u8_files_for_track(
+    track_id: str,
+    local_file_path: str,
+    m3u8_updates: dict[str, dict[str, str]] | None = None,
+) -> None:
     """Update all M3U8 files that contain a specific track.
 
     Replaces the track comment line with the actual file path in all
@@ -1172,22 +1816,24 @@ def _update_m3u8_files_for_track(track_id: str, local_file_path: str) -> None:
     Args:
         track_id: Track identifier
         local_file_path: Absolute path to the downloaded file
+        m3u8_updates: If given, updates are queued here (M3U8 path -> {track_id: path})
+            so each file can be rewritten once by _write_m3u8_updates()
 
     """
     try:
-        # Get all playlists that contain this track
-        playlist_urls = track_db.get_playlists_for_track(track_id)
+        # Get the M3U8 path of every playlist that contains this track
+        m3u8_paths = _get_track_db().get_m3u8_paths_for_track(track_id)
 
-        if not playlist_urls:
+        if not m3u8_paths:
             write_log.debug("TRACK_NO_PLAYLISTS", "Track not linked to any playlists.",
                            {"track_id": track_id})
             return
 
         # Update M3U8 file for each playlist
-        for playlist_url in playlist_urls:
-            m3u8_path = track_db.get_m3u8_path_for_playlist(playlist_url)
-
-            if m3u8_path:
+        for playlist_url, m3u8_path in m3u8_paths.items():
+            if m3u8_path and m3u8_updates is not None:
+                m3u8_updates.setdefault(m3u8_path, {})[track_id] = local_file_path
+            elif m3u8_path:
                 update_track_in_m3u8(m3u8_path, track_id, local_file_path)
                 write_log.debug("M3U8_TRACK_UPDATED", "Updated track in M3U8 file.",
                               {"track_id": track_id, "m3u8_path": m3u8_path})
@@ -1243,7 +1889,7 @@ def task_scrape_playlists() -> bool:
         # Persist CSV order into database for downstream ordering (XML, dashboard)
         try:
             for idx, purl in enumerate(playlists):
-                track_db.set_playlist_display_order(purl, idx)
+                _get_track_db().set_playlist_display_order(purl, idx)
         except Exception as e:
             write_log.error(
                 "PLAYLIST_ORDER_SET_FAIL",
@@ -1254,11 +1900,7 @@ def task_scrape_playlists() -> bool:
         _prune_missing_playlists(playlists)
 
         # Process each playlist
-        total_tracks = 0
-        for playlist_url in playlists:
-            tracks = process_playlist(playlist_url)
-            if tracks:
-                total_tracks += len(tracks)
+        total_tracks = sum(len(tracks) for tracks in process_playlists(playlists) if tracks)
 
         write_log.info("TASK_SCRAPE_COMPLETE", "Playlist scrape task completed.",
                       {"playlists_processed": len(playlists), "tracks_found": total_tracks})
@@ -1292,25 +1934,9 @@ def task_initiate_searches() -> bool:
             return False
 
         # Get tracks that need searching
+        # 'searching' is not a candidate status, so tracks with an active search are excluded
         candidates_statuses = ["pending", "new", "not_found", "no_suitable_file", "corrupt", "failed", "blacklisted"]
-        tracks_to_search = []
-
-        for status in candidates_statuses:
-            rows = track_db.get_tracks_by_status(status)
-            for track_row in rows:
-                # Skip if there is already an active search for this track
-                track_id = track_row[0]
-                current_status = track_db.get_track_status(track_id)
-                if current_status == "searching":
-                    write_log.debug(
-                        "TASK_INITIATE_SEARCH_SKIP_SEARCHING",
-                        "Skipping track with active search.",
-                        {"track_id": track_id},
-                    )
-                    continue
-                track_name = track_row[1]
-                artist = track_row[2]
-                tracks_to_search.append((track_id, artist, track_name))
+        tracks_to_search = _get_track_db().get_tracks_for_search(candidates_statuses)
 
         if not tracks_to_search:
             write_log.info("TASK_INITIATE_SEARCHES_NO_TRACKS",
@@ -1474,6 +2100,8 @@ def task_export_library() -> bool:
     """
     write_log.info("TASK_EXPORT_LIBRARY_START", "Starting library export task.")
 
+    from scripts.xml_exporter import export_itunes_xml  # noqa: PLC0415
+
     try:
         xml_path = config.get_xml_export_path()
         music_folder_url = config.get_music_folder_url()
@@ -1491,11 +2119,7 @@ def task_export_library() -> bool:
         return False
 
 
-def _determine_remux_target(
-    current_extension: str,
-    lossless_formats: set[str],
-    lossy_formats: set[str],
-) -> tuple[bool, str | None]:
+def _determine_remux_target(current_extension: str) -> tuple[bool, str | None]:
     """Determine if a file needs remuxing and what the target format should be.
 
     Decision logic based on PREFER_MP3 setting:
@@ -1504,94 +2128,101 @@ def _determine_remux_target(
 
     Args:
         current_extension: Current file extension (lowercase)
-        lossless_formats: Set of lossless format extensions
-        lossy_formats: Set of lossy format extensions
 
     Returns:
         Tuple of (needs_remux, target_format). target_format is None if no remux needed.
 
     """
-    if PREFER_MP3:
-        return current_extension != "mp3", "mp3" if current_extension != "mp3" else None
-
-    if current_extension in lossless_formats:
-        return current_extension != "wav", "wav" if current_extension != "wav" else None
-
-    if current_extension in lossy_formats:
-        return current_extension != "mp3", "mp3" if current_extension != "mp3" else None
+    # Unknown extensions are only converted when everything should end up as MP3
+    target_format = _REMUX_TARGET_BY_EXTENSION.get(current_extension, "mp3" if PREFER_MP3 else None)
+    return target_format is not None, target_format
 
-    return False, None
 
-
-def _remux_single_track(track_id: str, lossless_formats: set[str], lossy_formats: set[str]) -> str:
-    """Remux a single track to match current format preferences.
-
-    Handles the complete remux workflow for one track:
-    1. Validates file exists and has determinable extension
-    2. Determines if remuxing is needed based on current settings
-    3. Performs remux and updates database/M3U8 files
+def _get_existing_remux_target(
+    track_id: str,
+    local_file_path: str | None,
+    current_extension: str | None,
+) -> tuple[str, str, str] | None:
+    """Check whether a completed track's file must be remuxed to match current format preferences.
 
     Args:
         track_id: Track identifier
-        lossless_formats: Set of lossless format extensions
-        lossy_formats: Set of lossy format extensions
+        local_file_path: Stored path of the track's file
+        current_extension: Stored extension of the track's file
 
     Returns:
-        Status string: "remuxed", "skipped", or "error"
+        Tuple of (local_file_path, current_extension, target_format), or None if the
+        track is skipped (no file, unknown extension, or already in the target format)
 
     """
-    status = "skipped"
-    local_file_path = track_db.get_local_file_path(track_id)
     if not local_file_path:
         write_log.debug("TASK_REMUX_NO_PATH", "Track has no file path, skipping.",
                         {"track_id": track_id})
-        return status
+        return None
 
     if not os.path.exists(local_file_path):
         write_log.warn("TASK_REMUX_FILE_NOT_FOUND", "File not found, skipping.",
                        {"track_id": track_id, "path": local_file_path})
-        return status
+        return None
 
-    current_extension = track_db.get_track_extension(track_id)
-    if not current_extension and "." in local_file_path:
+    if current_extension:
+        current_extension = current_extension.lower()
+    elif "." in local_file_path:
         current_extension = local_file_path.rsplit(".", 1)[-1].lower()
 
     if not current_extension:
         write_log.warn("TASK_REMUX_NO_EXTENSION", "Cannot determine file extension.",
                        {"track_id": track_id, "path": local_file_path})
-        return status
+        return None
 
-    needs_remux, target_format = _determine_remux_target(current_extension, lossless_formats, lossy_formats)
+    needs_remux, target_format = _determine_remux_target(current_extension)
     if not needs_remux or not target_format:
-        return status
+        return None
 
-    write_log.info("TASK_REMUX_FILE", "Remuxing file to target format.",
-                  {"track_id": track_id, "current_ext": current_extension,
-                   "target_format": target_format, "path": local_file_path})
+    return local_file_path, current_extension, target_format
 
-    try:
-        new_path: str | None = None
 
-        if target_format == "wav":
-            new_path = _remux_lossless_to_wav(local_file_path, track_id, current_extension)
-        elif target_format == "mp3":
-            new_path = _remux_lossy_to_mp3(local_file_path, track_id, current_extension)
+def _finish_existing_remux(  # noqa: PLR0913
+    track_id: str,
+    local_file_path: str,
+    current_extension: str,
+    target_format: str,
+    error: Exception | None,
+    *,
+    m3u8_updates: dict[str, dict[str, str]],
+) -> str:
+    """Record a finished remux of an existing file and point the database and M3U8s at the new file.
+
+    Args:
+        track_id: Track identifier
+        local_file_path: Path of the file that was remuxed
+        current_extension: Extension of that file
+        target_format: Target format ("wav" or "mp3")
+        error: Result of _run_remux_job()
+        m3u8_updates: M3U8 updates for the new path are queued here for _write_m3u8_updates()
+
+    Returns:
+        Status string: "remuxed", "skipped", or "error"
+
+    """
+    try:
+        new_path = _apply_remux_result(local_file_path, track_id, current_extension, target_format, error)
 
         if new_path and new_path != local_file_path:
-            track_db.update_local_file_path(track_id, new_path)
-            _update_m3u8_files_for_track(track_id, new_path)
+            _get_track_db().update_local_file_path(track_id, new_path)
+            _update_m3u8_files_for_track(track_id, new_path, m3u8_updates)
             write_log.info("TASK_REMUX_SUCCESS", "File remuxed successfully.",
                           {"track_id": track_id, "old_path": local_file_path,
                            "new_path": new_path})
-            status = "remuxed"
+            return "remuxed"
 
     except Exception as e:
         write_log.error("TASK_REMUX_FILE_ERROR", "Failed to remux file.",
                         {"track_id": track_id, "path": local_file_path,
                          "error": str(e)})
-        status = "error"
+        return "error"
 
-    return status
+    return "skipped"
 
 
 def task_remux_existing_files() -> bool:
@@ -1602,7 +2233,7 @@ def task_remux_existing_files() -> bool:
     2. Files that need conversion after user changes PREFER_MP3 setting
 
     The task:
-    1. Gets all completed tracks from database
+    1. Gets completed tracks not already in a target format from database
     2. Determines target format based on PREFER_MP3:
        - If True: All files should be MP3 320kbps
        - If False: Lossless should be WAV, lossy should be MP3 320kbps
@@ -1610,8 +2241,11 @@ def task_remux_existing_files() -> bool:
     4. Updates database with new paths and extensions
     5. Updates M3U8 playlists with new file paths
 
-    This task is interruptible - it processes files one at a time and can be
-    safely stopped at any point.
+    FFmpeg runs on up to REMUX_MAX_WORKERS threads (default: one per CPU core).
+    Each file's database update is applied as soon as its remux finishes; M3U8
+    updates are queued and written every _M3U8_FLUSH_INTERVAL_SECONDS (and when
+    the task ends or is stopped), so each playlist is rewritten once per flush
+    instead of once per track.
 
     Returns:
         True if successful, False if failed
@@ -1621,8 +2255,9 @@ def task_remux_existing_files() -> bool:
                   {"prefer_mp3": PREFER_MP3})
 
     try:
-        # Get all completed tracks
-        completed_tracks = track_db.get_tracks_by_status("completed")
+        # Only completed tracks not already stored in a target format can need a remux
+        target_extensions = {"mp3"} if PREFER_MP3 else {"mp3", "wav"}
+        completed_tracks = _get_track_db().get_completed_tracks_needing_remux(target_extensions)
 
         if not completed_tracks:
             write_log.info("TASK_REMUX_NO_FILES", "No completed tracks to check.")
@@ -1630,23 +2265,47 @@ def task_remux_existing_files() -> bool:
 
         write_log.info("TASK_REMUX_CHECKING", f"Checking {len(completed_tracks)} completed tracks.")
 
-        # Include mp3 in lossy for the remux target check
-        lossy_with_mp3 = LOSSY_FORMATS | {"mp3"}
-
-        remuxed_count = 0
-        skipped_count = 0
-        error_count = 0
-
-        for track_row in completed_tracks:
-            track_id = track_row[0]
-            result = _remux_single_track(track_id, LOSSLESS_FORMATS, lossy_with_mp3)
-
-            if result == "remuxed":
-                remuxed_count += 1
-            elif result == "error":
-                error_count += 1
-            else:
-                skipped_count += 1
+        jobs = {}
+        for track_id, local_file_path, extension in completed_tracks:
+            target = _get_existing_remux_target(track_id, local_file_path, extension)
+            if target:
+                jobs[track_id] = target
+
+        results: Counter[str] = Counter(skipped=len(completed_tracks) - len(jobs))
+        if jobs:
+            max_workers = _remux_worker_count(len(jobs))
+            threads = _ffmpeg_thread_count(max_workers)
+            m3u8_updates: dict[str, dict[str, str]] = {}
+            next_flush = time.monotonic() + _M3U8_FLUSH_INTERVAL_SECONDS
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {}
+                    for track_id, (local_file_path, current_extension, target_format) in jobs.items():
+                        write_log.info("TASK_REMUX_FILE", "Remuxing file to target format.",
+                                      {"track_id": track_id, "current_ext": current_extension,
+                                       "target_format": target_format, "path": local_file_path})
+                        future = executor.submit(
+                            _run_remux_job, local_file_path, track_id, current_extension, target_format, threads,
+                        )
+                        futures[future] = track_id
+
+                    for future in as_completed(futures):
+                        track_id = futures[future]
+                        status = _finish_existing_remux(
+                            track_id, *jobs[track_id], future.result(), m3u8_updates=m3u8_updates,
+                        )
+                        results[status] += 1
+                        if time.monotonic() >= next_flush:
+                            _write_m3u8_updates(m3u8_updates)
+                            m3u8_updates.clear()
+                            next_flush = time.monotonic() + _M3U8_FLUSH_INTERVAL_SECONDS
+            finally:
+                # Written even if the task is stopped, so playlists never point at removed originals
+                _write_m3u8_updates(m3u8_updates)
+
+        remuxed_count = results["remuxed"]
+        skipped_count = results["skipped"]
+        error_count = results["error"]
 
         write_log.info("TASK_REMUX_EXISTING_COMPLETE",
                       "Existing files remux task completed.",
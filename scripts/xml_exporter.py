@@ -28,26 +28,60 @@ Public API:
 - extract_file_metadata(): Extract metadata from an audio file
 """
 
-import io
+import functools
+import json
 import os
-import xml.etree.ElementTree as ET
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Any
-from urllib.parse import quote
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Any, TextIO
+from xml.sax.saxutils import escape
 
+from dotenv import load_dotenv
 from mutagen import File as MutagenFile
-from mutagen.flac import FLAC
-from mutagen.mp3 import MP3
+from mutagen.flac import FLAC, FLACNoHeaderError
+from mutagen.mp3 import MP3, HeaderNotFoundError
 
 from scripts.database_management import TrackDB
 from scripts.logs_utils import write_log
 
+load_dotenv()
+
+# Docker container paths start with this prefix; it is swapped for the host path in exports
+_CONTAINER_PATH_PREFIX = "/app/"
+
+# Host-side replacement for _CONTAINER_PATH_PREFIX, or None when not running under Docker
+_HOST_PATH_PREFIX = f"{os.getenv('HOST_BASE_PATH')}/" if os.getenv("HOST_BASE_PATH") else None
+
+# Percent-encoding of every byte for file location URLs; matches quote(part, safe="")
+_URL_SAFE_BYTES = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_.~")
+_URL_ENCODED_BYTES = [chr(b) if b in _URL_SAFE_BYTES else f"%{b:02X}" for b in range(256)]
+
+# Audio files whose metadata is read concurrently during an export (reads are I/O bound)
+METADATA_READ_WORKERS = 16
+
+# Tracks read from the database and parsed per round, bounding how many rows are held at once
+METADATA_READ_BATCH_SIZE = 256
+
+# Stored with every cached metadata entry; entries with another version are parsed again, so
+# bumping it discards metadata cached by an older or faulty parser
+_METADATA_CACHE_VERSION = 2
+
+# Write buffer of the export file; the plist is written as many small fragments
+_EXPORT_WRITE_BUFFER_BYTES = 1 << 20
+
+# Parsers opened directly by extension, skipping mutagen's format detection for the common formats,
+# with the error each raises when the file's content is not in its format
+_AUDIO_PARSER_BY_EXTENSION = {".mp3": (MP3, HeaderNotFoundError), ".flac": (FLAC, FLACNoHeaderError)}
+
 
 def convert_to_windows_path(container_path: str) -> str:
     """Convert a Docker container path to a Windows host path.
 
-    If HOST_BASE_PATH environment variable is set, replaces /app/ prefix
-    with the Windows host path. Otherwise, returns the path unchanged.
+    If HOST_BASE_PATH environment variable was set when the module was loaded,
+    replaces /app/ prefix with the Windows host path. Otherwise, returns the path unchanged.
 
     Args:
         container_path: File path as stored in database (may be container path)
@@ -56,16 +90,14 @@ def convert_to_windows_path(container_path: str) -> str:
         Windows host path suitable for file:// URLs
 
     Example:
-        >>> os.environ['HOST_BASE_PATH'] = 'E:/Projects/spotiseek'
+        >>> # With HOST_BASE_PATH=E:/Projects/spotiseek
         >>> convert_to_windows_path('/app/downloads/file.mp3')
         'E:/Projects/spotiseek/downloads/file.mp3'
 
     """
-    host_base_path = os.getenv("HOST_BASE_PATH")
-
     # Convert Docker container paths to host paths
-    if host_base_path and container_path.startswith("/app/"):
-        container_path = container_path.replace("/app/", f"{host_base_path}/", 1)
+    if _HOST_PATH_PREFIX and container_path.startswith(_CONTAINER_PATH_PREFIX):
+        return _HOST_PATH_PREFIX + container_path[len(_CONTAINER_PATH_PREFIX):]
 
     return container_path
 
@@ -93,50 +125,69 @@ def format_file_location_url(local_file_path: str) -> str:
     # Normalize path separators to forward slashes
     normalized_path = windows_path.replace("\\", "/")
 
-    # Split into components and URL-encode each one
-    path_parts = normalized_path.split("/")
-    encoded_parts = [quote(part, safe="") for part in path_parts if part]
-    encoded_path = "/".join(encoded_parts)
+    # URL-encode each component; the directory part repeats across an album or artist, so
+    # its encoding is cached and only the file name is encoded per track
+    directory, _, file_name = normalized_path.rpartition("/")
+    encoded_parts = [_encode_url_directory(directory), _quote_path_component(file_name)]
+    encoded_path = "/".join(part for part in encoded_parts if part)
 
     return f"file://localhost/{encoded_path}"
 
 
+@functools.lru_cache(maxsize=8192)
+def _encode_url_directory(directory: str) -> str:
+    """URL-encode each component of a forward-slash directory path, dropping empty ones."""
+    return "/".join(_quote_path_component(part) for part in directory.split("/") if part)
+
+
+def _quote_path_component(part: str) -> str:
+    """Percent-encode a single path component through the precomputed byte table."""
+    return "".join([_URL_ENCODED_BYTES[b] for b in part.encode("utf-8")])
+
+
 def _extract_mp3_tags(audio: MP3, metadata: dict[str, Any]) -> None:
     """Extract album, genre, and year from MP3 ID3 tags."""
-    if not audio.tags:
+    tags = audio.tags
+    if not tags:
         return
 
     # Album
-    if "TALB" in audio.tags and hasattr(audio.tags["TALB"], "text") and audio.tags["TALB"].text:
-        metadata["album"] = str(audio.tags["TALB"].text[0])
+    if album := _id3_frame_text(tags, "TALB"):
+        metadata["album"] = str(album[0])
 
     # Genre
-    if "TCON" in audio.tags and hasattr(audio.tags["TCON"], "text") and audio.tags["TCON"].text:
-        metadata["genre"] = str(audio.tags["TCON"].text[0])
+    if genre := _id3_frame_text(tags, "TCON"):
+        metadata["genre"] = str(genre[0])
 
     # Year - try TDRC first (ID3v2.4), then TYER (ID3v2.3)
-    if "TDRC" in audio.tags and hasattr(audio.tags["TDRC"], "text") and audio.tags["TDRC"].text:
-        year_str = str(audio.tags["TDRC"].text[0])[:4]
+    if recording_date := _id3_frame_text(tags, "TDRC"):
+        year_str = str(recording_date[0])[:4]
         if year_str and year_str.isdigit():
             metadata["year"] = int(year_str)
-    elif "TYER" in audio.tags and hasattr(audio.tags["TYER"], "text") and audio.tags["TYER"].text:
-        year_str = str(audio.tags["TYER"].text[0])
+    elif year := _id3_frame_text(tags, "TYER"):
+        year_str = str(year[0])
         if year_str and year_str.isdigit():
             metadata["year"] = int(year_str)
 
 
+def _id3_frame_text(tags: Any, frame_id: str) -> list | None:
+    """Return the text of an ID3 frame, or None if the frame is missing or has no text."""
+    frame = tags.get(frame_id)
+    return getattr(frame, "text", None) if frame is not None else None
+
+
 def _extract_flac_tags(audio: FLAC, metadata: dict[str, Any]) -> None:
     """Extract album, genre, and year from FLAC Vorbis comments."""
-    if not audio.tags:
+    tags = audio.tags
+    if not tags:
         return
 
-    if audio.tags.get("album"):
-        metadata["album"] = audio.tags["album"][0]
-    if audio.tags.get("genre"):
-        metadata["genre"] = audio.tags["genre"][0]
-    if audio.tags.get("date"):
-        date_str = audio.tags["date"][0]
-        year_str = date_str[:4]
+    if album := tags.get("album"):
+        metadata["album"] = album[0]
+    if genre := tags.get("genre"):
+        metadata["genre"] = genre[0]
+    if date := tags.get("date"):
+        year_str = date[0][:4]
         if year_str and year_str.isdigit():
             metadata["year"] = int(year_str)
 
@@ -183,11 +234,12 @@ def _extract_audio_info(audio: Any, metadata: dict[str, Any]) -> None:
         metadata["duration_ms"] = int(audio.info.length * 1000)
 
 
-def extract_file_metadata(local_file_path: str) -> dict[str, Any]:
+def extract_file_metadata(local_file_path: str, stat_info: os.stat_result | None = None) -> dict[str, Any]:
     """Extract metadata from an audio file using mutagen.
 
     Args:
         local_file_path: Absolute path to the audio file
+        stat_info: The file's os.stat() result if the caller already has it
 
     Returns:
         Dictionary containing file metadata:
@@ -201,6 +253,17 @@ def extract_file_metadata(local_file_path: str) -> dict[str, Any]:
         - genre: Genre (string)
         - year: Year (integer)
 
+    """
+    return _read_file_metadata(local_file_path, stat_info)[0]
+
+
+def _read_file_metadata(local_file_path: str, stat_info: os.stat_result | None) -> tuple[dict[str, Any], bool]:
+    """Extract metadata like extract_file_metadata(), also telling whether the audio was parsed.
+
+    Returns:
+        Tuple of (metadata, parsed) where parsed is False if the file was missing or could
+        not be parsed, in which case metadata holds at most the stat-based fields
+
     """
     metadata = {
         "file_size": None,
@@ -217,24 +280,33 @@ def extract_file_metadata(local_file_path: str) -> dict[str, Any]:
     try:
         file_path = local_file_path
 
-        if not os.path.exists(file_path):
-            write_log.warn("FILE_NOT_FOUND", "File not found for metadata extraction.",
-                          {"file_path": file_path})
-            return metadata
-
-        # Get file system metadata
-        stat_info = os.stat(file_path)
-        metadata["file_size"] = stat_info.st_size
-        metadata["date_modified"] = datetime.fromtimestamp(stat_info.st_mtime).isoformat() + "Z"
-        metadata["date_added"] = datetime.fromtimestamp(stat_info.st_ctime).isoformat() + "Z"
-
-        # Get audio metadata using mutagen
-        audio = MutagenFile(file_path, easy=False)
+        # Get file system metadata (a single stat also tells whether the file exists)
+        if stat_info is None:
+            try:
+                stat_info = os.stat(file_path)
+            except FileNotFoundError:
+                write_log.warn("FILE_NOT_FOUND", "File not found for metadata extraction.",
+                              {"file_path": file_path})
+                return metadata, False
+        _add_stat_metadata(stat_info, metadata)
+
+        # Get audio metadata using mutagen; only files whose content isn't in the format of
+        # their extension fall back to format detection, other errors fail the extraction
+        audio = None
+        parser = _AUDIO_PARSER_BY_EXTENSION.get(os.path.splitext(file_path)[1].lower())
+        if parser is not None:
+            parser_class, format_mismatch_error = parser
+            try:
+                audio = parser_class(file_path)
+            except format_mismatch_error:
+                audio = None
+        if audio is None:
+            audio = MutagenFile(file_path, easy=False)
 
         if audio is None:
             write_log.warn("MUTAGEN_PARSE_FAIL", "Failed to parse audio file.",
                           {"file_path": file_path})
-            return metadata
+            return metadata, False
 
         # Extract audio info (bitrate, sample rate, duration)
         _extract_audio_info(audio, metadata)
@@ -253,8 +325,68 @@ def extract_file_metadata(local_file_path: str) -> dict[str, Any]:
     except Exception as e:
         write_log.warn("METADATA_EXTRACT_FAIL", "Failed to extract file metadata.",
                        {"file_path": local_file_path, "error": str(e)})
+        return metadata, False
+
+    return metadata, True
+
+
+def _add_stat_metadata(stat_info: os.stat_result, metadata: dict[str, Any]) -> None:
+    """Set the file size and modified/added dates of metadata from a stat result."""
+    metadata["file_size"] = stat_info.st_size
+    metadata["date_modified"] = datetime.fromtimestamp(stat_info.st_mtime).isoformat() + "Z"
+    metadata["date_added"] = datetime.fromtimestamp(stat_info.st_ctime).isoformat() + "Z"
+
+
+def _extract_cached_file_metadata(
+    local_file_path: str, meta_json: str | None, meta_mtime: float | None, meta_size: int | None,
+    *, parsed_by_file: dict[tuple[int, int, int, int], Future],
+) -> tuple[dict[str, Any], tuple[str, float, int] | None]:
+    """Return a file's metadata, reusing the cached copy while the file is unchanged.
+
+    The cached metadata is used when the file's mtime and size still match the ones it
+    was read at and it was stored under the current _METADATA_CACHE_VERSION; only the
+    stat-based fields are refreshed. Otherwise the file is parsed, unless the same file
+    (e.g. a hard link shared by several tracks) was already parsed during this export.
+    Only successful parses are returned for caching, so a failed read is retried next time.
+
+    Args:
+        parsed_by_file: Futures of the metadata parsed during this export, keyed by
+                        (st_dev, st_ino, st_mtime_ns, st_size) of the file
 
-    return metadata
+    Returns:
+        Tuple of (metadata, cache_entry) where cache_entry is the (meta_json, mtime, size)
+        to store for the track, or None if the cached copy is still valid or the parse failed
+
+    """
+    try:
+        stat_info = os.stat(local_file_path)
+    except OSError:
+        # Missing or unreadable files are reported by extract_file_metadata()
+        return extract_file_metadata(local_file_path), None
+
+    if meta_json is not None and meta_mtime == stat_info.st_mtime and meta_size == stat_info.st_size:
+        cached = json.loads(meta_json)
+        if cached.get("version") == _METADATA_CACHE_VERSION:
+            metadata = cached["metadata"]
+            _add_stat_metadata(stat_info, metadata)
+            return metadata, None
+
+    # setdefault is atomic, so of several workers reaching the same file only one parses it
+    # and the others wait for its result
+    file_key = (stat_info.st_dev, stat_info.st_ino, stat_info.st_mtime_ns, stat_info.st_size)
+    new_future: Future = Future()
+    parsed = parsed_by_file.setdefault(file_key, new_future)
+    if parsed is new_future:
+        try:
+            parsed.set_result(_read_file_metadata(local_file_path, stat_info))
+        except Exception as e:
+            # Hand the error to any waiting workers instead of leaving them blocked
+            parsed.set_exception(e)
+    metadata, parsed_ok = parsed.result()
+    if not parsed_ok:
+        return metadata, None
+    meta_json = json.dumps({"version": _METADATA_CACHE_VERSION, "metadata": metadata})
+    return metadata, (meta_json, stat_info.st_mtime, stat_info.st_size)
 
 
 def export_itunes_xml(xml_path: str, music_folder_url: str | None = None) -> None:
@@ -284,193 +416,246 @@ def export_itunes_xml(xml_path: str, music_folder_url: str | None = None) -> Non
     conn = db.conn
     cursor = conn.cursor()
 
-    # Fetch all tracks from database, excluding those marked for redownload, failed, or with no file path
-    cursor.execute("""
-        SELECT track_id, track_name, artist, download_status,
-               slskd_file_name, local_file_path, added_at, genre
-        FROM tracks
-        WHERE local_file_path IS NOT NULL
-        AND download_status NOT IN ('redownload_pending', 'failed')
-    """)
-    tracks = cursor.fetchall()
-    write_log.debug(
-        "XML_TRACKS_FETCHED",
-        "Fetched tracks from database (excluding redownload_pending and failed).",
-        {"count": len(tracks)}
-    )
-
-    # Fetch all playlists in display order (as per CSV)
-    cursor.execute(
-        "SELECT playlist_url, playlist_name FROM playlists "
-        "ORDER BY display_order IS NULL, display_order",
-    )
-    playlists = cursor.fetchall()
-    write_log.debug("XML_PLAYLISTS_FETCHED", "Fetched playlists from database.", {"count": len(playlists)})
-
-    # Fetch playlist-track associations
-    cursor.execute("SELECT playlist_url, track_id FROM playlist_tracks")
-    playlist_tracks_raw = cursor.fetchall()
-    playlist_tracks = {}
-    for playlist_url, track_id in playlist_tracks_raw:
-        playlist_tracks.setdefault(playlist_url, []).append(track_id)
-    write_log.debug("XML_ASSOCIATIONS_FETCHED", "Fetched playlist-track associations.",
-                   {"count": len(playlist_tracks_raw)})
-
-    # Build XML structure
-    plist = ET.Element("plist", version="1.0")
-    dict_root = ET.SubElement(plist, "dict")
-
-    # Add top-level metadata
-    _add_xml_key_value(dict_root, "Major Version", "1", "integer")
-    _add_xml_key_value(dict_root, "Minor Version", "1", "integer")
-    _add_xml_key_value(dict_root, "Application Version", "3.5.8698.34385", "string")
-    _add_xml_key_value(dict_root, "Music Folder", music_folder_url or "", "string")
-    _add_xml_key_value(dict_root, "Library Persistent ID", "SPOTISEEKLIB0000001", "string")
-
-    # Build tracks dictionary
-    ET.SubElement(dict_root, "key").text = "Tracks"
-    tracks_dict = ET.SubElement(dict_root, "dict")
-
-    # Map track_id to track integer ID (only for downloaded tracks)
-    source_id_to_track_id = {}
-    downloaded_tracks = tracks  # All tracks from SQL query are already filtered
-    write_log.info("XML_DOWNLOADED_TRACKS", "Filtered downloaded tracks.",
-                   {"total_tracks": len(tracks), "downloaded_tracks": len(downloaded_tracks)})
-
-    for idx, (track_id, track_name, artist, _, _, local_file_path, _, genre) in enumerate(downloaded_tracks, 1):
-        try:
-            _add_track_to_xml(tracks_dict, idx, track_name, artist, track_id, local_file_path, genre)
-            source_id_to_track_id[track_id] = idx
-        except Exception as e:
-            write_log.error(
-                "XML_TRACK_ADD_FAIL",
-                "Failed to add track to XML.",
-                {"track_idx": idx, "track_id": track_id, "error": str(e)},
-            )
-
-    # Build playlists array
-    ET.SubElement(dict_root, "key").text = "Playlists"
-    playlists_array = ET.SubElement(dict_root, "array")
-
-    for playlist_idx, (playlist_url, playlist_name) in enumerate(playlists, 1):
-        _add_playlist_to_xml(
-            playlists_array,
-            playlist_idx,
-            playlist_name or playlist_url,
-            playlist_tracks.get(playlist_url, []),
-            source_id_to_track_id,
-        )
-
-    # Write XML to file with proper formatting
-    tree = ET.ElementTree(plist)
-    ET.indent(tree, space="\t", level=0)
-
-    # Generate XML string
-    xml_io = io.BytesIO()
-    tree.write(xml_io, encoding="utf-8", xml_declaration=False)
-    xml_content = xml_io.getvalue().decode("utf-8")
-
-    # Write with proper DOCTYPE and header
-    with open(xml_path, "w", encoding="utf-8") as f:
+    # The plist is rendered as text fragments (laid out like ElementTree with tab indentation)
+    # and streamed to a temp file that replaces xml_path once complete, so memory stays flat
+    # however large the library is and readers never see a half-written export
+    tmp_path = xml_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", buffering=_EXPORT_WRITE_BUFFER_BYTES) as f:
         f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
         f.write('<!DOCTYPE plist PUBLIC "-//Apple Computer//DTD PLIST 1.0//EN" ')
         f.write('"http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n')
-        f.write(xml_content.lstrip())
+        f.write('<plist version="1.0">\n\t<dict>\n')
+
+        # Add top-level metadata
+        root_parts: list[str] = []
+        _add_xml_key_value(root_parts, "Major Version", "1", "integer", "\t\t")
+        _add_xml_key_value(root_parts, "Minor Version", "1", "integer", "\t\t")
+        _add_xml_key_value(root_parts, "Application Version", "3.5.8698.34385", "string", "\t\t")
+        _add_xml_key_value(root_parts, "Music Folder", music_folder_url or "", "string", "\t\t")
+        _add_xml_key_value(root_parts, "Library Persistent ID", "SPOTISEEKLIB0000001", "string", "\t\t")
+        root_parts.append(_xml_element("key", "Tracks", "\t\t"))
+        f.writelines(root_parts)
+
+        # Fetch tracks, excluding those marked for redownload, failed, or with no file path;
+        # rows are read from the cursor as they are written instead of fetched all at once
+        cursor.execute("""
+            SELECT track_id, track_name, artist, local_file_path, genre, meta_json, meta_mtime, meta_size
+            FROM tracks
+            WHERE local_file_path IS NOT NULL
+            AND download_status NOT IN ('redownload_pending', 'failed')
+        """)
+        # Map track_id to its rendered playlist item (only for exported tracks)
+        metadata_cache_entries: list[tuple[str, str, float, int]] = []
+        source_id_to_playlist_item = _write_tracks_xml(f, cursor, metadata_cache_entries)
+        db.set_file_metadata_cache_bulk(metadata_cache_entries)
+
+        # Fetch all playlists in display order (as per CSV) together with their track IDs in the
+        # order they were linked; a playlist without tracks comes back as one row with a NULL track_id
+        cursor.execute("""
+            SELECT p.playlist_url, p.playlist_name, pt.track_id
+            FROM playlists p
+            LEFT JOIN playlist_tracks pt ON pt.playlist_url = p.playlist_url
+            ORDER BY p.display_order IS NULL, p.display_order, p.rowid, pt.rowid
+        """)
+        playlists_parts: list[str] = []
+        playlist_count = 0
+        for playlist_count, ((playlist_url, playlist_name), rows) in enumerate(
+            groupby(cursor, key=itemgetter(0, 1)), 1,
+        ):
+            _add_playlist_to_xml(
+                playlists_parts,
+                playlist_count,
+                playlist_name or playlist_url,
+                [row[2] for row in rows if row[2] is not None],
+                source_id_to_playlist_item,
+            )
+        write_log.debug("XML_PLAYLISTS_FETCHED", "Fetched playlists from database.", {"count": playlist_count})
+
+        f.write(_xml_element("key", "Playlists", "\t\t"))
+        container_parts: list[str] = []
+        _add_xml_container(container_parts, "array", playlists_parts, "\t\t")
+        f.writelines(container_parts)
+        f.write("\t</dict>\n</plist>")
+
+    os.replace(tmp_path, xml_path)
 
     write_log.info("XML_EXPORT_SUCCESS", "Exported iTunes XML successfully.", {"xml_path": xml_path})
 
 
+def _write_tracks_xml(
+    f: TextIO, rows: Iterable[tuple], metadata_cache_entries: list[tuple[str, str, float, int]],
+) -> dict[str, str]:
+    """Write the Tracks dictionary of the plist, one track at a time.
+
+    Args:
+        f: Output file positioned after the Tracks key
+        rows: (track_id, track_name, artist, local_file_path, genre, meta_json, meta_mtime, meta_size)
+              rows to export
+        metadata_cache_entries: Receives (track_id, meta_json, meta_mtime, meta_size) for every
+                                track whose file had to be parsed
+
+    Returns:
+        Mapping of track_id to the rendered playlist item of every exported track,
+        built once here and reused by every playlist containing the track
+
+    """
+    source_id_to_playlist_item: dict[str, str] = {}
+    row_count = 0
+    rows = iter(rows)
+    parsed_by_file: dict[tuple[int, int, int, int], Future] = {}
+    # Audio files are parsed on worker threads a batch at a time; XML is rendered here in row order
+    with ThreadPoolExecutor(max_workers=METADATA_READ_WORKERS) as executor:
+        while batch := list(islice(rows, METADATA_READ_BATCH_SIZE)):
+            batch_metadata = executor.map(
+                lambda row: _extract_cached_file_metadata(row[3], *row[5:], parsed_by_file=parsed_by_file), batch,
+            )
+            for (track_id, track_name, artist, local_file_path, genre, *_), (file_metadata, cache_entry) in zip(
+                batch, batch_metadata, strict=True,
+            ):
+                row_count += 1
+                if cache_entry is not None:
+                    metadata_cache_entries.append((track_id, *cache_entry))
+                track_parts: list[str] = []
+                try:
+                    _add_track_to_xml(
+                        track_parts, row_count, track_name, artist, track_id, local_file_path, genre,
+                        file_metadata=file_metadata,
+                    )
+                except Exception as e:
+                    write_log.error(
+                        "XML_TRACK_ADD_FAIL",
+                        "Failed to add track to XML.",
+                        {"track_idx": row_count, "track_id": track_id, "error": str(e)},
+                    )
+                    continue
+                if not source_id_to_playlist_item:
+                    f.write("\t\t<dict>\n")
+                f.writelines(track_parts)
+                source_id_to_playlist_item[track_id] = _playlist_item_xml(row_count)
+
+    f.write("\t\t</dict>\n" if source_id_to_playlist_item else "\t\t<dict />\n")
+    write_log.info("XML_DOWNLOADED_TRACKS", "Exported downloaded tracks.",
+                   {"total_tracks": row_count, "downloaded_tracks": len(source_id_to_playlist_item)})
+    return source_id_to_playlist_item
+
+
 # Helper functions for XML construction
 
-def _add_xml_key_value(parent: ET.Element, key: str, value: str, value_type: str) -> None:
-    """Add a key-value pair to XML dict element."""
-    ET.SubElement(parent, "key").text = key
-    ET.SubElement(parent, value_type).text = value
+def _xml_element(tag: str, text: str, indent: str) -> str:
+    """Render a single-line element; empty text gives a self-closing tag like ElementTree does."""
+    if not text:
+        return f"{indent}<{tag} />\n"
+    return f"{indent}<{tag}>{escape(text)}</{tag}>\n"
+
+
+def _add_xml_container(parts: list[str], tag: str, children: list[str], indent: str) -> None:
+    """Add an element wrapping already rendered child lines to parts."""
+    if not children:
+        parts.append(f"{indent}<{tag} />\n")
+        return
+    parts.append(f"{indent}<{tag}>\n")
+    parts.extend(children)
+    parts.append(f"{indent}</{tag}>\n")
+
+
+def _add_xml_key_value(parts: list[str], key: str, value: str, value_type: str, indent: str) -> None:
+    """Add a key-value pair of an XML dict element to parts."""
+    parts.append(_xml_element("key", key, indent))
+    parts.append(_xml_element(value_type, value, indent))
 
 
 def _add_track_to_xml(  # noqa: PLR0913
-    tracks_dict: ET.Element, track_idx: int, track_name: str,
+    tracks_parts: list[str], track_idx: int, track_name: str,
     artist: str, track_id: str, local_file_path: str, genre: str | None = None,
+    *, file_metadata: dict[str, Any],
 ) -> None:
-    """Add a track entry to the tracks dictionary with file metadata."""
-    track_key = ET.SubElement(tracks_dict, "key")
-    track_key.text = str(track_idx)
-    track_dict = ET.SubElement(tracks_dict, "dict")
-
-    # Extract metadata from the actual file
-    file_metadata = extract_file_metadata(local_file_path)
+    """Add a track entry to the tracks dictionary with file metadata from extract_file_metadata()."""
+    # Rendered separately so a failing track leaves no partial entry behind
+    track_parts: list[str] = []
+    indent = "\t\t\t\t"
 
     # Basic track information
-    _add_xml_key_value(track_dict, "Track ID", str(track_idx), "integer")
-    _add_xml_key_value(track_dict, "Name", track_name or "", "string")
-    _add_xml_key_value(track_dict, "Artist", artist or "", "string")
+    _add_xml_key_value(track_parts, "Track ID", str(track_idx), "integer", indent)
+    _add_xml_key_value(track_parts, "Name", track_name or "", "string", indent)
+    _add_xml_key_value(track_parts, "Artist", artist or "", "string", indent)
 
     # Add album if available
     if file_metadata.get("album"):
-        _add_xml_key_value(track_dict, "Album", file_metadata["album"], "string")
+        _add_xml_key_value(track_parts, "Album", file_metadata["album"], "string", indent)
 
     # Add year if available
     if file_metadata.get("year"):
-        _add_xml_key_value(track_dict, "Year", str(file_metadata["year"]), "integer")
+        _add_xml_key_value(track_parts, "Year", str(file_metadata["year"]), "integer", indent)
 
     # Add genre from database if available (from Spotify/SoundCloud)
     if genre:
-        _add_xml_key_value(track_dict, "Genre", genre, "string")
+        _add_xml_key_value(track_parts, "Genre", genre, "string", indent)
 
     # File type and format
-    _add_xml_key_value(track_dict, "Kind", "MPEG audio file", "string")
+    _add_xml_key_value(track_parts, "Kind", "MPEG audio file", "string", indent)
 
     # Add file size if available
     if file_metadata.get("file_size"):
-        _add_xml_key_value(track_dict, "Size", str(file_metadata["file_size"]), "integer")
+        _add_xml_key_value(track_parts, "Size", str(file_metadata["file_size"]), "integer", indent)
 
     # Add duration if available
     if file_metadata.get("duration_ms"):
-        _add_xml_key_value(track_dict, "Total Time", str(file_metadata["duration_ms"]), "integer")
+        _add_xml_key_value(track_parts, "Total Time", str(file_metadata["duration_ms"]), "integer", indent)
 
     # Add dates
     if file_metadata.get("date_modified"):
-        ET.SubElement(track_dict, "key").text = "Date Modified"
-        ET.SubElement(track_dict, "date").text = file_metadata["date_modified"]
+        _add_xml_key_value(track_parts, "Date Modified", file_metadata["date_modified"], "date", indent)
 
     if file_metadata.get("date_added"):
-        ET.SubElement(track_dict, "key").text = "Date Added"
-        ET.SubElement(track_dict, "date").text = file_metadata["date_added"]
+        _add_xml_key_value(track_parts, "Date Added", file_metadata["date_added"], "date", indent)
 
     # Add bitrate if available
     if file_metadata.get("bitrate"):
-        _add_xml_key_value(track_dict, "Bit Rate", str(file_metadata["bitrate"]), "integer")
+        _add_xml_key_value(track_parts, "Bit Rate", str(file_metadata["bitrate"]), "integer", indent)
 
     # Add sample rate if available
     if file_metadata.get("sample_rate"):
-        _add_xml_key_value(track_dict, "Sample Rate", str(file_metadata["sample_rate"]), "integer")
+        _add_xml_key_value(track_parts, "Sample Rate", str(file_metadata["sample_rate"]), "integer", indent)
 
     # Track identification
-    _add_xml_key_value(track_dict, "Persistent ID", track_id or "", "string")
-    _add_xml_key_value(track_dict, "Track Type", "File", "string")
-    _add_xml_key_value(track_dict, "Location", format_file_location_url(local_file_path), "string")
+    _add_xml_key_value(track_parts, "Persistent ID", track_id or "", "string", indent)
+    _add_xml_key_value(track_parts, "Track Type", "File", "string", indent)
+    _add_xml_key_value(track_parts, "Location", format_file_location_url(local_file_path), "string", indent)
 
+    tracks_parts.append(_xml_element("key", str(track_idx), "\t\t\t"))
+    _add_xml_container(tracks_parts, "dict", track_parts, "\t\t\t")
 
-def _add_playlist_to_xml(playlists_array: ET.Element, playlist_id: int,
+
+def _playlist_item_xml(track_idx: int) -> str:
+    """Render the playlist item referencing the track with the given Track ID."""
+    item_parts = ["\t\t\t\t\t<dict>\n"]
+    _add_xml_key_value(item_parts, "Track ID", str(track_idx), "integer", "\t\t\t\t\t\t")
+    item_parts.append("\t\t\t\t\t</dict>\n")
+    return "".join(item_parts)
+
+
+def _add_playlist_to_xml(playlists_parts: list[str], playlist_id: int,
                         playlist_name: str, track_ids: list,
-                        source_id_to_track_id: dict) -> None:
+                        source_id_to_playlist_item: dict) -> None:
     """Add a playlist entry to the playlists array."""
-    playlist_dict = ET.SubElement(playlists_array, "dict")
+    playlist_parts: list[str] = []
+    indent = "\t\t\t\t"
 
-    _add_xml_key_value(playlist_dict, "Playlist ID", str(playlist_id), "integer")
+    _add_xml_key_value(playlist_parts, "Playlist ID", str(playlist_id), "integer", indent)
 
     # Generate persistent ID
     persistent_id = f"PL{playlist_id:014X}"
-    _add_xml_key_value(playlist_dict, "Playlist Persistent ID", persistent_id, "string")
+    _add_xml_key_value(playlist_parts, "Playlist Persistent ID", persistent_id, "string", indent)
+
+    _add_xml_key_value(playlist_parts, "All Items", "", "true", indent)
+    _add_xml_key_value(playlist_parts, "Name", playlist_name, "string", indent)
 
-    _add_xml_key_value(playlist_dict, "All Items", "", "true")
-    _add_xml_key_value(playlist_dict, "Name", playlist_name, "string")
+    # Add playlist items (tracks that weren't exported are skipped)
+    items_parts = [
+        item for track_id in track_ids if (item := source_id_to_playlist_item.get(track_id)) is not None
+    ]
 
-    # Add playlist items
-    ET.SubElement(playlist_dict, "key").text = "Playlist Items"
-    items_array = ET.SubElement(playlist_dict, "array")
+    playlist_parts.append(_xml_element("key", "Playlist Items", indent))
+    _add_xml_container(playlist_parts, "array", items_parts, indent)
 
-    for track_id in track_ids:
-        if track_id in source_id_to_track_id:
-            item_dict = ET.SubElement(items_array, "dict")
-            _add_xml_key_value(item_dict, "Track ID", str(source_id_to_track_id[track_id]), "integer")
+    _add_xml_container(playlists_parts, "dict", playlist_parts, "\t\t\t")